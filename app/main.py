@@ -5,6 +5,7 @@ All functionality in one streamlined application
 """
 
 import os
+import io
 import sys
 import json
 import sqlite3
@@ -12,8 +13,14 @@ import threading
 import time
 import logging
 import signal
+import queue
 import hashlib
-from datetime import datetime, timedelta
+import heapq
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -22,8 +29,10 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # Lightweight web framework
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, g, has_app_context, session
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
 from bs4 import BeautifulSoup
 import schedule
@@ -40,6 +49,16 @@ try:
 except ImportError:
     Image = ImageDraw = ImageFont = ImageFilter = ImageEnhance = None
 
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:
+    lxml_etree = lxml_html = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging with better error handling
 log_dir = 'logs'
 os.makedirs(log_dir, exist_ok=True)
@@ -62,6 +81,305 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hot statements are kept as module-level constants so every call passes
+# sqlite3 the same SQL text and reuses the compiled statement from the
+# connection's statement cache instead of re-parsing it
+SQL_INSERT_ARTICLE = '''
+    INSERT OR IGNORE INTO articles (feed_id, title, url, description, content, published_date, relevance_score, wifi_keywords)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_INSERT_WEB_ARTICLE = '''
+    INSERT OR IGNORE INTO articles (
+        feed_id, title, url, description, published_date, 
+        relevance_score, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+SQL_INSERT_WEB_FEED = 'INSERT OR IGNORE INTO rss_feeds (name, url, active) VALUES (?, ?, ?)'
+SQL_SET_ARTICLE_IMAGE = 'UPDATE articles SET image_url = ? WHERE id = ?'
+# URL batches are passed as one JSON array, so the SQL text doesn't change
+# with the batch size (an IN list of placeholders would compile a new
+# statement for every distinct length)
+SQL_EXISTING_URLS = 'SELECT url FROM articles WHERE url IN (SELECT value FROM json_each(?))'
+SQL_ARTICLE_IDS = 'SELECT url, id FROM articles WHERE url IN (SELECT value FROM json_each(?))'
+SQL_TOUCH_FEED = '''
+    UPDATE rss_feeds SET last_fetched = CURRENT_TIMESTAMP, etag = ?, last_modified = ?
+    WHERE id = ?
+'''
+# UPSERT updates the row in place; INSERT OR REPLACE would delete and
+# re-insert it on every save
+SQL_SAVE_SETTING = '''
+    INSERT INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+'''
+# Writes a setting only if the key is new; rowcount tells the caller which
+SQL_CLAIM_SETTING = '''
+    INSERT OR IGNORE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+'''
+SQL_SEED_ARTICLES = '''
+    SELECT title, url, description, source FROM seed_articles
+    WHERE event_pattern = (
+        SELECT event_pattern FROM seed_articles
+        WHERE instr(?, event_pattern) > 0
+        ORDER BY id LIMIT 1
+    )
+    ORDER BY id
+'''
+SQL_LINK_EVENT_ARTICLE = '''
+    INSERT OR IGNORE INTO event_articles (event_id, article_id, relevance_score)
+    VALUES (?, ?, ?)
+'''
+
+# Feed downloads run in parallel, but no more than a few at once against
+# any single host (many Google News feeds share one)
+FEED_FETCH_WORKERS = 16
+FEED_FETCH_PER_HOST = 4
+
+# Layouts the templates know, selected with ?view=
+VIEW_MODES = ('newspaper', 'reader')
+
+# Old articles are removed this many rows per transaction
+CLEANUP_BATCH_SIZE = 500
+
+# BeautifulSoup tree builder for scraped pages: lxml's C parser when it is
+# installed, otherwise the much slower pure-Python one
+SOUP_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def html_to_text(markup):
+    """Strip tags from an HTML fragment, decode entities and collapse whitespace"""
+    if not markup:
+        return ''
+    text = None
+    # Plain text and short snippets are cheaper to clean with a regex than
+    # to parse
+    if lxml_html is not None and len(markup) > 200 and '<' in markup:
+        try:
+            text = lxml_html.fromstring(markup).text_content()
+        except (lxml_etree.ParserError, ValueError):
+            text = None
+    if text is None:
+        text = unescape(_TAG_RE.sub('', markup))
+    # split() collapses whitespace runs and trims the ends in one C call
+    return ' '.join(text.split())
+
+
+def search_text(article):
+    """Lowercased title and description that keyword scans run against"""
+    return f"{article['title']} {article['description']}".lower()
+
+
+def with_search_text(rows):
+    """Copy rows into dicts carrying a precomputed _search_text field"""
+    articles = []
+    for row in rows:
+        article = dict(row)
+        article['_search_text'] = search_text(article)
+        articles.append(article)
+    return articles
+
+
+def feed_title(content):
+    """Return the title of an RSS/Atom document, or None if it has none
+    
+    Only the channel (or feed) title is needed, so with lxml the document is
+    read as a stream and parsing stops there, before any entries. Documents
+    lxml rejects as malformed go through feedparser, which is more lenient.
+    """
+    if lxml_etree is not None:
+        try:
+            for _, element in lxml_etree.iterparse(io.BytesIO(content), events=('end',),
+                                                   resolve_entities=False, no_network=True):
+                if lxml_etree.QName(element).localname != 'title':
+                    continue
+                parent = element.getparent()
+                if parent is not None and lxml_etree.QName(parent).localname in ('channel', 'feed'):
+                    return html_to_text(element.text) or None
+            return None
+        except lxml_etree.XMLSyntaxError:
+            pass
+    return feedparser.parse(content).feed.get('title') or None
+
+
+@lru_cache(maxsize=256)
+def event_keywords(hashtags):
+    """Normalized keywords from an event's comma-separated hashtags.
+    
+    Cached on the hashtags text itself, so routes that score every request
+    against the same events don't re-split it, and an edited event simply
+    produces a new key.
+    """
+    if not hashtags:
+        return ()
+    # Stray commas and bare '#' would leave empty keywords, which match
+    # every text and can't be searched for
+    keywords = (tag.replace('#', '').lower().strip() for tag in hashtags.split(','))
+    return tuple(keyword for keyword in keywords if keyword)
+
+
+@lru_cache(maxsize=256)
+def keyword_matcher(keywords):
+    """Aho-Corasick automaton over a tuple of keywords, or None.
+    
+    Payloads are bitmasks of keyword positions, so one pass over a text
+    gives the set of matched keywords as a single int. None without
+    pyahocorasick, or when a keyword is empty: an empty keyword matches
+    everything and can't go in an automaton.
+    """
+    if ahocorasick is None or not keywords or not all(keywords):
+        return None
+    masks = {}
+    for bit, keyword in enumerate(keywords):
+        masks[keyword] = masks.get(keyword, 0) | (1 << bit)
+    matcher = ahocorasick.Automaton()
+    for keyword, mask in masks.items():
+        matcher.add_word(keyword, mask)
+    matcher.make_automaton()
+    return matcher
+
+
+def count_keyword_matches(keywords, text, matcher=None):
+    """Count the keywords that occur in lowercased text, using matcher if given"""
+    if matcher is None:
+        return sum(1 for keyword in keywords if keyword in text)
+    mask = 0
+    for _, bits in matcher.iter(text):
+        mask |= bits
+    return bin(mask).count('1')
+
+
+def parse_date(value):
+    """Parse the date part of a stored 'YYYY-MM-DD...' value.
+    
+    Out-of-range days roll over the way SQLite's date() does, so a stored
+    '2027-02-29' reads as 2027-03-01. A value that isn't a date gives None,
+    as date() gives NULL.
+    """
+    try:
+        year, month, day = (int(part) for part in str(value)[:10].split('-'))
+        return date(year, month, 1) + timedelta(days=day - 1)
+    except (ValueError, OverflowError):
+        return None
+
+
+def date_bounds(start, end, days_before=0, days_after=0):
+    """Return half-open [lower, upper) ISO bounds from start-days_before through end+days_after.
+    
+    Comparing published_date directly against these keeps the predicate
+    sargable, unlike wrapping the column in DATE(). Returns None if either
+    date can't be parsed, where DATE() would have matched nothing.
+    """
+    start, end = parse_date(start), parse_date(end)
+    if start is None or end is None:
+        return None
+    lower = start - timedelta(days=days_before)
+    upper = end + timedelta(days=days_after + 1)
+    return lower.isoformat(), upper.isoformat()
+
+
+def utc_today():
+    """Today's date in UTC, the same day SQLite's date('now') returns"""
+    return datetime.now(timezone.utc).date()
+
+
+def days_ago(days):
+    """ISO date string for the UTC date `days` days back"""
+    return (utc_today() - timedelta(days=days)).isoformat()
+
+
+def current_week():
+    """Return (today, week_start) for the digest week, which starts on Monday"""
+    today = utc_today()
+    return today, today - timedelta(days=today.weekday())
+
+
+class PreparedStatements:
+    """Hot article statements bound to one connection for the fetch loop"""
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def existing_urls(self, urls):
+        """Return the subset of urls already stored, in a single query"""
+        if not urls:
+            return set()
+        rows = self.conn.execute(SQL_EXISTING_URLS, (json.dumps(list(urls)),))
+        return {row[0] for row in rows}
+    
+    def article_ids(self, urls):
+        """Map each stored url in urls to its article id"""
+        if not urls:
+            return {}
+        rows = self.conn.execute(SQL_ARTICLE_IDS, (json.dumps(list(urls)),))
+        return {row[0]: row[1] for row in rows}
+    
+    def insert_articles(self, rows):
+        """Insert article rows in one executemany; returns how many were new"""
+        if not rows:
+            return 0
+        return self.conn.executemany(SQL_INSERT_ARTICLE, rows).rowcount
+    
+    def set_article_images(self, updates):
+        """Apply (image_url, article_id) pairs in one executemany"""
+        self.conn.executemany(SQL_SET_ARTICLE_IMAGE, updates)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() hands it back to its pool"""
+    
+    pool = None
+    checked_out = False
+    # Bumped on every acquire so a holder can tell whether it still owns this checkout
+    checkout = 0
+    
+    def close(self):
+        if self.pool is not None and self.checked_out:
+            self.checked_out = False
+            self.pool.release(self)
+        elif self.pool is None:
+            super().close()
+    
+    def discard(self):
+        """Really close the connection instead of returning it"""
+        self.pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """Keeps opened SQLite connections around for reuse across requests.
+    
+    Flask's threaded server runs each request on a new thread, so the pool
+    is shared between threads; a connection is only ever held by one
+    checkout at a time. The most recently returned connection is handed
+    out first so its page cache is still warm.
+    """
+    
+    def __init__(self, connect, size=8):
+        self._connect = connect
+        self._idle = queue.LifoQueue(maxsize=size)
+    
+    def acquire(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+            conn.pool = self
+        conn.checkout += 1
+        conn.checked_out = True
+        return conn
+    
+    def release(self, conn):
+        try:
+            # Anything the caller left uncommitted is discarded, as closing would
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.discard()
+
+
 class WirelessMonitor:
     def __init__(self):
         # Get the directory where this script is located
@@ -80,6 +398,58 @@ class WirelessMonitor:
         self.app.secret_key = 'wireless-monitor-secret-key'
         self.db_path = 'data/wireless_monitor.db'
         self.running = True
+        # Set on shutdown so the scheduler thread wakes up immediately
+        self._shutdown_event = threading.Event()
+        self._db_pool = ConnectionPool(self.open_db_connection)
+        
+        # Small writes from request handlers go through one writer thread,
+        # which commits whatever has queued up together
+        self._write_queue = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        
+        # Shared HTTP session for feed downloads, so repeat fetches from the
+        # same host reuse kept-alive connections instead of a new TLS handshake
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        self.http.headers.update({'User-Agent': 'WirelessMonitor/1.0'})
+        
+        # Feed list for the admin page, loaded lazily and kept in sync on writes
+        self._feeds_cache = None
+        self._feeds_cache_lock = threading.Lock()
+        
+        # Rendered dashboard pages by (query string, date), each kept for
+        # 30 seconds as (rendered_at, html)
+        self._index_page_cache = {}
+        self._index_page_lock = threading.Lock()
+        
+        # Rendered events pages by (query string, date), kept for two minutes
+        # and dropped whenever an event is added or removed
+        self._events_page_cache = {}
+        self._events_page_lock = threading.Lock()
+        
+        # Enabled platforms for the share popup, loaded lazily and dropped
+        # when the social settings are saved
+        self._social_platforms_cache = None
+        self._social_platforms_lock = threading.Lock()
+        
+        # Recent articles behind the insights page, reused for a minute
+        self._recent_articles_cache = None
+        self._recent_articles_lock = threading.Lock()
+        
+        # Generated insights as (expires_at, updated_ts, insights), mirroring
+        # the copy stored in settings so page loads skip the database
+        self._insights_cache = None
+        self._insights_lock = threading.Lock()
+        
+        # Only one maintenance task (force update / reset) runs at a time
+        self._maintenance_lock = threading.Lock()
+        # Held for the duration of a feed fetch, so scheduled, initial and
+        # manual fetches never run on top of each other
+        self._fetch_lock = threading.Lock()
+        self._last_maintenance_start = 0
         
         # Wi-Fi keywords for relevance scoring
         self.wifi_keywords = [
@@ -89,6 +459,84 @@ class WirelessMonitor:
             'telecommunications', 'radio', 'signal', 'interference', 'latency',
             'bandwidth', 'throughput', 'iot', 'internet of things', 'smart home'
         ]
+        self._wifi_keyword_tuple = tuple(self.wifi_keywords)
+        
+        # Each keyword gets one bit, so the keywords found in a text are a
+        # single int and counting (important) matches is a popcount
+        self._wifi_keyword_bits = tuple((1 << i, keyword) for i, keyword in enumerate(self._wifi_keyword_tuple))
+        self._important_keyword_mask = 0
+        for bit, keyword in self._wifi_keyword_bits:
+            if keyword in ('wifi', 'wi-fi', 'wireless', '5g', '6g'):
+                self._important_keyword_mask |= bit
+        
+        # With pyahocorasick installed, all keywords are found in one pass
+        # over the text instead of one substring search per keyword
+        self._wifi_automaton = None
+        if ahocorasick is not None:
+            self._wifi_automaton = ahocorasick.Automaton()
+            for bit, keyword in self._wifi_keyword_bits:
+                self._wifi_automaton.add_word(keyword, bit)
+            self._wifi_automaton.make_automaton()
+        
+        # Keywords for the insights page, checked in order: timelines
+        # (What's New/Next/Now), technology categories and trend buckets
+        self.insight_timeline_keywords = {
+            'whats_new': ['launch', 'announce', 'release', 'debut', 'unveil', 'introduce', 'new'],
+            'whats_next': ['future', 'roadmap', 'plan', 'expect', 'predict', 'forecast', 'upcoming'],
+            'whats_now': ['adopt', 'deploy', 'implement', 'rollout', 'available', 'shipping']
+        }
+        self.insight_categories = {
+            'Wi-Fi 6/6E/7': ['wifi 6', 'wi-fi 6', 'wifi 7', 'wi-fi 7', '802.11ax', '802.11be', '6ghz'],
+            '5G/6G': ['5g', '6g', 'mmwave', 'sub-6', 'standalone', 'non-standalone'],
+            'IoT/Edge': ['iot', 'edge computing', 'smart city', 'industrial iot', 'edge ai'],
+            'Security': ['cybersecurity', 'zero trust', 'encryption', 'authentication', 'vpn'],
+            'Enterprise': ['enterprise', 'business', 'corporate', 'workplace', 'hybrid work'],
+            'Standards': ['ieee', 'standard', 'specification', 'protocol', 'certification']
+        }
+        self.trend_keywords = {
+            'Wi-Fi 6/7': ['wifi 6', 'wi-fi 6', 'wifi 7', 'wi-fi 7', '802.11ax', '802.11be'],
+            '5G': ['5g', 'mmwave', 'sub-6'],
+            'IoT': ['iot', 'internet of things', 'smart'],
+            'Security': ['security', 'cybersecurity', 'zero trust', 'encryption'],
+            'AI/ML': ['ai', 'artificial intelligence', 'machine learning', 'ml'],
+            'Cloud': ['cloud', 'saas', 'paas', 'iaas']
+        }
+        self._insight_groups = (
+            ('timeline', self.insight_timeline_keywords),
+            ('category', self.insight_categories),
+            ('trend', self.trend_keywords),
+        )
+        
+        # Short technology tokens like 'ai', 'iot' or '5g' only count as
+        # whole words ('ai' must not match "said"); everything else, including
+        # the timeline stems like 'announce', matches as a substring. A
+        # keyword can belong to several timelines, categories or trends.
+        substring_tags = {}
+        word_tags = {}
+        for bucket, groups in self._insight_groups:
+            for tag, keywords in groups.items():
+                for keyword in keywords:
+                    whole_word = bucket != 'timeline' and len(keyword) <= 4 and keyword.isalnum()
+                    target = word_tags if whole_word else substring_tags
+                    target.setdefault(keyword, []).append((bucket, tag))
+        self._insight_substring_tags = {keyword: tuple(tags) for keyword, tags in substring_tags.items()}
+        self._insight_word_tags = {keyword: tuple(tags) for keyword, tags in word_tags.items()}
+        self._insight_word_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, sorted(word_tags, key=len, reverse=True))) + r')\b'
+        )
+        
+        # One automaton finds every keyword in a single pass; whole-word
+        # keywords carry their length so the match boundaries can be checked
+        self._insight_automaton = None
+        if ahocorasick is not None:
+            self._insight_automaton = ahocorasick.Automaton()
+            for keyword in set(self._insight_substring_tags) | set(self._insight_word_tags):
+                self._insight_automaton.add_word(keyword, (
+                    len(keyword),
+                    self._insight_substring_tags.get(keyword, ()),
+                    self._insight_word_tags.get(keyword, ()),
+                ))
+            self._insight_automaton.make_automaton()
         
         # Ensure directories exist
         os.makedirs('data', exist_ok=True)
@@ -143,358 +591,778 @@ class WirelessMonitor:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         
-        # RSS feeds table
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS rss_feeds (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                active INTEGER DEFAULT 1,
-                last_fetched TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Articles table
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                feed_id INTEGER,
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                description TEXT,
-                content TEXT,
-                published_date TIMESTAMP,
-                relevance_score REAL DEFAULT 0,
-                entertainment_score REAL DEFAULT 0,
-                wifi_keywords TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (feed_id) REFERENCES rss_feeds (id)
-            )
-        ''')
+        # WAL lets readers run alongside the fetch writer; the journal mode is
+        # stored in the database file, so setting it once here is enough
+        conn.execute('PRAGMA journal_mode=WAL')
         
-        # Add new columns if they don't exist (for existing databases)
+        # Bootstrap the schema and seed data in one transaction so startup
+        # commits (and syncs the WAL) once instead of after every statement
+        conn.isolation_level = None
+        conn.execute('BEGIN IMMEDIATE')
         try:
-            conn.execute('ALTER TABLE articles ADD COLUMN content TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # RSS feeds table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS rss_feeds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    url TEXT UNIQUE NOT NULL,
+                    active INTEGER DEFAULT 1,
+                    last_fetched TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        try:
-            conn.execute('ALTER TABLE articles ADD COLUMN wifi_keywords TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # Articles table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    feed_id INTEGER,
+                    title TEXT NOT NULL,
+                    url TEXT UNIQUE NOT NULL,
+                    description TEXT,
+                    content TEXT,
+                    published_date TIMESTAMP,
+                    relevance_score REAL DEFAULT 0,
+                    entertainment_score REAL DEFAULT 0,
+                    wifi_keywords TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (feed_id) REFERENCES rss_feeds (id)
+                )
+            ''')
         
-        try:
-            conn.execute('ALTER TABLE articles ADD COLUMN image_url TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # System settings table
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Events table for tracking industry events
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS industry_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                hashtags TEXT,
-                start_date DATE,
-                end_date DATE,
-                location TEXT,
-                description TEXT,
-                active INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Event articles table for event-specific content
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS event_articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_id INTEGER,
-                article_id INTEGER,
-                relevance_score REAL DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES industry_events (id),
-                FOREIGN KEY (article_id) REFERENCES articles (id)
-            )
-        ''')
-        
-        # Social media configuration table
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS social_config (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL UNIQUE,
-                username TEXT,
-                enabled INTEGER DEFAULT 0,
-                api_key TEXT,
-                api_secret TEXT,
-                access_token TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Weekly digest table
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS weekly_digest (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_id INTEGER,
-                added_by TEXT DEFAULT 'user',
-                notes TEXT,
-                added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                week_start DATE,
-                FOREIGN KEY (article_id) REFERENCES articles (id)
-            )
-        ''')
-        
-        # Wild Wi-Fi stories table for humorous real-world wireless content
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS wild_wifi_stories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                story TEXT NOT NULL,
-                location TEXT,
-                source_url TEXT,
-                category TEXT DEFAULT 'general',
-                humor_rating INTEGER DEFAULT 3,
-                tech_relevance TEXT,
-                submitted_by TEXT DEFAULT 'system',
-                approved INTEGER DEFAULT 1,
-                featured INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Social shares table for tracking shared articles
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS social_shares (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_id INTEGER,
-                platform TEXT NOT NULL,
-                share_url TEXT,
-                shared_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (article_id) REFERENCES articles (id)
-            )
-        ''')
+            # Add new columns if they don't exist (for existing databases)
+            try:
+                conn.execute('ALTER TABLE articles ADD COLUMN content TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
         
-        # Add default social media platforms if they don't exist
-        default_platforms = ['Twitter', 'LinkedIn', 'Facebook', 'Mastodon', 'Instagram']
-        for platform in default_platforms:
-            existing = conn.execute('SELECT id FROM social_config WHERE platform = ?', (platform,)).fetchone()
-            if not existing:
+            try:
+                conn.execute('ALTER TABLE articles ADD COLUMN wifi_keywords TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+        
+            try:
+                conn.execute('ALTER TABLE articles ADD COLUMN image_url TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+        
+            # HTTP validators from the last fetch, sent back as a conditional GET
+            for column in ('etag', 'last_modified'):
+                try:
+                    conn.execute(f'ALTER TABLE rss_feeds ADD COLUMN {column} TEXT')
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+        
+            # Date-window queries compare published_date directly, so index it;
+            # relevance_score rides along so the "recent and relevant" filters
+            # used by the dashboard and insights are answered from the index
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_pubdate_relevance
+                ON articles (published_date, relevance_score)
+            ''')
+            conn.execute('DROP INDEX IF EXISTS idx_articles_pubdate')  # superseded by the index above
+        
+            # Deleting a feed removes its articles by feed_id
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_feed ON articles (feed_id, published_date)')
+            
+            # Deleting a feed takes its articles with it, in the same statement
+            # (articles was created without ON DELETE CASCADE, and adding it
+            # would mean rebuilding the table under the full-text triggers)
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS rss_feeds_delete_articles AFTER DELETE ON rss_feeds BEGIN
+                    DELETE FROM articles WHERE feed_id = old.id;
+                END
+            ''')
+            
+            # The dashboard ranks by relevance then recency, and its filter ORs
+            # in event-linked articles of any age, so no range index applies;
+            # walking this index in order avoids sorting every article before LIMIT
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_relevance
+                ON articles (relevance_score, published_date)
+            ''')
+        
+            # Full-text index over article titles and descriptions for keyword
+            # matching; kept in sync with the articles table by triggers
+            try:
+                fts_exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+                ).fetchone()
                 conn.execute('''
-                    INSERT INTO social_config (platform, enabled)
-                    VALUES (?, 0)
-                ''', (platform,))
-                logger.info(f"Added social platform: {platform}")
-        
-        # Clear existing placeholder events to allow dynamic detection
-        # conn.execute('DELETE FROM industry_events WHERE name LIKE "CES%" OR name LIKE "NRF%"')
-        # conn.execute('DELETE FROM event_articles WHERE event_id NOT IN (SELECT id FROM industry_events)')
-        
-        logger.info("Cleared placeholder events - system will now detect events dynamically")
-        
-        # Add default feeds if none exist
-        feed_count = conn.execute('SELECT COUNT(*) FROM rss_feeds').fetchone()[0]
-        if feed_count == 0:
-            default_feeds = [
-                ('Ars Technica Technology', 'https://feeds.arstechnica.com/arstechnica/technology-lab'),
-                ('TechCrunch', 'https://techcrunch.com/feed/'),
-                ('The Verge', 'https://www.theverge.com/rss/index.xml'),
-                ('IEEE Spectrum', 'https://spectrum.ieee.org/rss'),
-                ('Fierce Wireless', 'https://www.fiercewireless.com/rss/xml'),
-                ('RCR Wireless News', 'https://www.rcrwireless.com/feed'),
-                ('Engadget', 'https://www.engadget.com/rss.xml'),
-                ('Wired Technology', 'https://www.wired.com/feed/category/gear/rss'),
-            ]
+                    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                        title, description, content='articles', content_rowid='id'
+                    )
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                        INSERT INTO articles_fts (rowid, title, description)
+                        VALUES (new.id, new.title, new.description);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                        INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                        VALUES ('delete', old.id, old.title, old.description);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, description ON articles BEGIN
+                        INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                        VALUES ('delete', old.id, old.title, old.description);
+                        INSERT INTO articles_fts (rowid, title, description)
+                        VALUES (new.id, new.title, new.description);
+                    END
+                ''')
+                if not fts_exists:
+                    # Index the articles that were stored before the table existed
+                    conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+                    logger.info("Built full-text index for existing articles")
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 not available, falling back to LIKE keyword search: {e}")
+                self.fts_enabled = False
+        
+            # System settings table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+        
+            # Events table for tracking industry events
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS industry_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    hashtags TEXT,
+                    start_date DATE,
+                    end_date DATE,
+                    location TEXT,
+                    description TEXT,
+                    active INTEGER DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+        
+            # Event articles table for event-specific content
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS event_articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id INTEGER,
+                    article_id INTEGER,
+                    relevance_score REAL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (event_id) REFERENCES industry_events (id),
+                    FOREIGN KEY (article_id) REFERENCES articles (id)
+                )
+            ''')
+        
+            # An article is linked to an event at most once; drop any duplicate
+            # links left by older versions before enforcing it
+            try:
+                conn.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_event_articles_event_article
+                    ON event_articles (event_id, article_id)
+                ''')
+            except sqlite3.IntegrityError:
+                conn.execute('''
+                    DELETE FROM event_articles WHERE id NOT IN (
+                        SELECT MIN(id) FROM event_articles GROUP BY event_id, article_id
+                    )
+                ''')
+                conn.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_event_articles_event_article
+                    ON event_articles (event_id, article_id)
+                ''')
+        
+            # Article-first lookups (the event joins on the front page and detail
+            # views) probe event_articles by article_id
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_event_articles_article
+                ON event_articles (article_id, event_id)
+            ''')
+        
+            # Social media configuration table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS social_config (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT NOT NULL UNIQUE,
+                    username TEXT,
+                    enabled INTEGER DEFAULT 0,
+                    api_key TEXT,
+                    api_secret TEXT,
+                    access_token TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+        
+            # Weekly digest table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS weekly_digest (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    article_id INTEGER,
+                    added_by TEXT DEFAULT 'user',
+                    notes TEXT,
+                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    week_start DATE,
+                    FOREIGN KEY (article_id) REFERENCES articles (id)
+                )
+            ''')
+            
+            # Digest pages list one week's picks and skip articles already
+            # picked for that week. An article is picked at most once a week;
+            # drop any duplicates left by older versions before enforcing it
+            conn.execute('DROP INDEX IF EXISTS idx_weekly_digest_week')  # superseded by the unique index
+            try:
+                conn.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_weekly_digest_week_article
+                    ON weekly_digest (week_start, article_id)
+                ''')
+            except sqlite3.IntegrityError:
+                conn.execute('''
+                    DELETE FROM weekly_digest WHERE id NOT IN (
+                        SELECT MIN(id) FROM weekly_digest GROUP BY week_start, article_id
+                    )
+                ''')
+                conn.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_weekly_digest_week_article
+                    ON weekly_digest (week_start, article_id)
+                ''')
+        
+            # Wild Wi-Fi stories table for humorous real-world wireless content
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS wild_wifi_stories (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    story TEXT NOT NULL,
+                    location TEXT,
+                    source_url TEXT,
+                    category TEXT DEFAULT 'general',
+                    humor_rating INTEGER DEFAULT 3,
+                    tech_relevance TEXT,
+                    submitted_by TEXT DEFAULT 'system',
+                    approved INTEGER DEFAULT 1,
+                    featured INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
             
-            for name, url in default_feeds:
+            # The Wild Wi-Fi page counts approved stories per category and
+            # filters by category; both read this index alone, already grouped
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_wild_wifi_approved_category
+                ON wild_wifi_stories (approved, category)
+            ''')
+        
+            # Social shares table for tracking shared articles
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS social_shares (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    article_id INTEGER,
+                    platform TEXT NOT NULL,
+                    share_url TEXT,
+                    shared_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (article_id) REFERENCES articles (id)
+                )
+            ''')
+        
+            # Add default social media platforms if they don't exist
+            # (platform is UNIQUE, so existing rows are skipped by the insert)
+            default_platforms = ['Twitter', 'LinkedIn', 'Facebook', 'Mastodon', 'Instagram']
+            added = conn.executemany('''
+                INSERT OR IGNORE INTO social_config (platform, enabled)
+                VALUES (?, 0)
+            ''', [(platform,) for platform in default_platforms]).rowcount
+            if added:
+                logger.info(f"Added {added} social platforms")
+        
+            # Clear existing placeholder events to allow dynamic detection
+            # conn.execute('DELETE FROM industry_events WHERE name LIKE "CES%" OR name LIKE "NRF%"')
+            # conn.execute('DELETE FROM event_articles WHERE event_id NOT IN (SELECT id FROM industry_events)')
+        
+            logger.info("Cleared placeholder events - system will now detect events dynamically")
+        
+            # Add default feeds if none exist
+            feed_count = conn.execute('SELECT COUNT(*) FROM rss_feeds').fetchone()[0]
+            if feed_count == 0:
+                default_feeds = [
+                    ('Ars Technica Technology', 'https://feeds.arstechnica.com/arstechnica/technology-lab'),
+                    ('TechCrunch', 'https://techcrunch.com/feed/'),
+                    ('The Verge', 'https://www.theverge.com/rss/index.xml'),
+                    ('IEEE Spectrum', 'https://spectrum.ieee.org/rss'),
+                    ('Fierce Wireless', 'https://www.fiercewireless.com/rss/xml'),
+                    ('RCR Wireless News', 'https://www.rcrwireless.com/feed'),
+                    ('Engadget', 'https://www.engadget.com/rss.xml'),
+                    ('Wired Technology', 'https://www.wired.com/feed/category/gear/rss'),
+                ]
+            
+                # url is UNIQUE, so a feed that already exists is skipped
+                added = conn.executemany('INSERT OR IGNORE INTO rss_feeds (name, url) VALUES (?, ?)', default_feeds).rowcount
+                logger.info(f"Added {added} default feeds")
+        
+            # Simulated event coverage used by web_search_for_articles
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS seed_articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_pattern TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    description TEXT,
+                    source TEXT
+                )
+            ''')
+        
+            seed_count = conn.execute('SELECT COUNT(*) FROM seed_articles').fetchone()[0]
+            if seed_count == 0:
+                seed_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_articles.json')
                 try:
-                    conn.execute('INSERT INTO rss_feeds (name, url) VALUES (?, ?)', (name, url))
-                    logger.info(f"Added default feed: {name}")
-                except sqlite3.IntegrityError:
-                    pass  # Feed already exists
-        
-        # Add some default Wild Wi-Fi stories if none exist
-        story_count = conn.execute('SELECT COUNT(*) FROM wild_wifi_stories').fetchone()[0]
-        if story_count == 0:
-            default_stories = [
-                {
-                    'title': 'Airport Wi-Fi Password Becomes Tourist Attraction',
-                    'story': 'A small regional airport in Montana discovered their Wi-Fi password "MontanaIsAwesome2024!" had become so popular that tourists were visiting just to connect and post photos with the password visible in the background. The airport now sells t-shirts with the password printed on them.',
-                    'location': 'Bozeman, Montana',
-                    'category': 'tourism',
-                    'humor_rating': 4,
-                    'tech_relevance': 'Shows how Wi-Fi access has become a destination feature rather than just a utility'
-                },
-                {
-                    'title': 'Smart Doorbell Alerts Neighbor About Package Theft',
-                    'story': 'A Ring doorbell\'s motion detection was so sensitive it kept alerting a neighbor across the street about activity on their own porch. Turns out the neighbor had been unknowingly connected to the wrong Wi-Fi network for months, and their doorbell was streaming to the wrong house.',
-                    'location': 'Suburban Ohio',
-                    'category': 'iot',
-                    'humor_rating': 5,
-                    'tech_relevance': 'Highlights the importance of proper IoT device configuration and network security'
-                },
-                {
-                    'title': 'Coffee Shop Creates "Productivity Zones" Based on Wi-Fi Speed',
-                    'story': 'A trendy coffee shop in Portland installed different Wi-Fi networks with varying speeds: "Espresso" (1 Gbps for urgent work), "Americano" (100 Mbps for regular browsing), and "Decaf" (10 Mbps for social media). Customers self-select based on their productivity needs.',
-                    'location': 'Portland, Oregon',
-                    'category': 'business',
-                    'humor_rating': 3,
-                    'tech_relevance': 'Creative approach to bandwidth management and user experience design'
-                },
-                {
-                    'title': 'Retirement Home Residents Become Wi-Fi Troubleshooters',
-                    'story': 'After the IT support at Sunny Acres Retirement Home quit, 78-year-old former engineer Margaret Chen started a "Wi-Fi Help Desk" run entirely by residents. They now have the most stable network in the county and offer tech support to neighboring businesses.',
-                    'location': 'San Diego, California',
-                    'category': 'community',
-                    'humor_rating': 4,
-                    'tech_relevance': 'Demonstrates that wireless technology adoption spans all age groups with proper support'
-                },
-                {
-                    'title': 'Food Truck Uses Wi-Fi Heat Map to Find Best Parking Spots',
-                    'story': 'A gourmet grilled cheese truck discovered that parking near areas with poor cellular coverage dramatically increased sales. Hungry office workers would flock to their truck\'s free Wi-Fi hotspot, staying to order food while their video calls finally worked.',
-                    'location': 'Austin, Texas',
-                    'category': 'business',
-                    'humor_rating': 4,
-                    'tech_relevance': 'Shows how connectivity gaps create unexpected business opportunities'
-                },
-                {
-                    'title': 'Smart Home Goes Rogue During Power Outage',
-                    'story': 'When the power went out in a "smart" neighborhood, one house\'s backup battery kept its Wi-Fi running. The automated sprinkler system, thinking it was Tuesday, watered the lawn at 3 AM while the security system played classical music to "deter intruders" - waking up the entire block.',
-                    'location': 'Palo Alto, California',
-                    'category': 'smart-home',
-                    'humor_rating': 5,
-                    'tech_relevance': 'Illustrates the need for better power management and automation logic in IoT systems'
-                }
-            ]
+                    with open(seed_file, encoding='utf-8') as f:
+                        seed_articles = json.load(f)
+                    conn.executemany('''
+                        INSERT INTO seed_articles (event_pattern, title, url, description, source)
+                        VALUES (:event_pattern, :title, :url, :description, :source)
+                    ''', seed_articles)
+                    logger.info(f"Loaded {len(seed_articles)} seed articles")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not load seed articles: {e}")
+        
+            # Add some default Wild Wi-Fi stories if none exist
+            story_count = conn.execute('SELECT COUNT(*) FROM wild_wifi_stories').fetchone()[0]
+            if story_count == 0:
+                default_stories = [
+                    {
+                        'title': 'Airport Wi-Fi Password Becomes Tourist Attraction',
+                        'story': 'A small regional airport in Montana discovered their Wi-Fi password "MontanaIsAwesome2024!" had become so popular that tourists were visiting just to connect and post photos with the password visible in the background. The airport now sells t-shirts with the password printed on them.',
+                        'location': 'Bozeman, Montana',
+                        'category': 'tourism',
+                        'humor_rating': 4,
+                        'tech_relevance': 'Shows how Wi-Fi access has become a destination feature rather than just a utility'
+                    },
+                    {
+                        'title': 'Smart Doorbell Alerts Neighbor About Package Theft',
+                        'story': 'A Ring doorbell\'s motion detection was so sensitive it kept alerting a neighbor across the street about activity on their own porch. Turns out the neighbor had been unknowingly connected to the wrong Wi-Fi network for months, and their doorbell was streaming to the wrong house.',
+                        'location': 'Suburban Ohio',
+                        'category': 'iot',
+                        'humor_rating': 5,
+                        'tech_relevance': 'Highlights the importance of proper IoT device configuration and network security'
+                    },
+                    {
+                        'title': 'Coffee Shop Creates "Productivity Zones" Based on Wi-Fi Speed',
+                        'story': 'A trendy coffee shop in Portland installed different Wi-Fi networks with varying speeds: "Espresso" (1 Gbps for urgent work), "Americano" (100 Mbps for regular browsing), and "Decaf" (10 Mbps for social media). Customers self-select based on their productivity needs.',
+                        'location': 'Portland, Oregon',
+                        'category': 'business',
+                        'humor_rating': 3,
+                        'tech_relevance': 'Creative approach to bandwidth management and user experience design'
+                    },
+                    {
+                        'title': 'Retirement Home Residents Become Wi-Fi Troubleshooters',
+                        'story': 'After the IT support at Sunny Acres Retirement Home quit, 78-year-old former engineer Margaret Chen started a "Wi-Fi Help Desk" run entirely by residents. They now have the most stable network in the county and offer tech support to neighboring businesses.',
+                        'location': 'San Diego, California',
+                        'category': 'community',
+                        'humor_rating': 4,
+                        'tech_relevance': 'Demonstrates that wireless technology adoption spans all age groups with proper support'
+                    },
+                    {
+                        'title': 'Food Truck Uses Wi-Fi Heat Map to Find Best Parking Spots',
+                        'story': 'A gourmet grilled cheese truck discovered that parking near areas with poor cellular coverage dramatically increased sales. Hungry office workers would flock to their truck\'s free Wi-Fi hotspot, staying to order food while their video calls finally worked.',
+                        'location': 'Austin, Texas',
+                        'category': 'business',
+                        'humor_rating': 4,
+                        'tech_relevance': 'Shows how connectivity gaps create unexpected business opportunities'
+                    },
+                    {
+                        'title': 'Smart Home Goes Rogue During Power Outage',
+                        'story': 'When the power went out in a "smart" neighborhood, one house\'s backup battery kept its Wi-Fi running. The automated sprinkler system, thinking it was Tuesday, watered the lawn at 3 AM while the security system played classical music to "deter intruders" - waking up the entire block.',
+                        'location': 'Palo Alto, California',
+                        'category': 'smart-home',
+                        'humor_rating': 5,
+                        'tech_relevance': 'Illustrates the need for better power management and automation logic in IoT systems'
+                    }
+                ]
             
-            for story in default_stories:
-                conn.execute('''
+                conn.executemany('''
                     INSERT INTO wild_wifi_stories (title, story, location, category, humor_rating, tech_relevance)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (story['title'], story['story'], story['location'], story['category'], story['humor_rating'], story['tech_relevance']))
-                logger.info(f"Added Wild Wi-Fi story: {story['title']}")
-        
-        conn.commit()
-        conn.close()
+                    VALUES (:title, :story, :location, :category, :humor_rating, :tech_relevance)
+                ''', default_stories)
+                logger.info(f"Added {len(default_stories)} Wild Wi-Fi stories")
+            
+            conn.execute('COMMIT')
+            
+            # Refresh planner statistics for tables that changed since the
+            # last run (e.g. while the app was down or after an upgrade)
+            conn.execute('PRAGMA analysis_limit=1000')
+            conn.execute('PRAGMA optimize')
+        except Exception:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
         logger.info("Database initialized")
     
     def get_db_connection(self):
-        """Get database connection with row factory and proper timeout"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        """Get a pooled database connection; close() returns it to the pool"""
+        conn = self._db_pool.acquire()
+        # Remember connections taken during a request so any a route forgets
+        # to close (early returns, exceptions) go back to the pool afterwards
+        if has_app_context():
+            g.setdefault('db_connections', []).append((conn, conn.checkout))
+        return conn
+    
+    def open_db_connection(self):
+        """Open a new database connection with row factory and proper timeout"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, cached_statements=256,
+                               check_same_thread=False, factory=PooledConnection)
         conn.row_factory = sqlite3.Row
-        # Enable WAL mode for better concurrent access
-        conn.execute('PRAGMA journal_mode=WAL')
+        # Per-connection settings, applied once since connections are pooled.
+        # WAL itself is enabled in init_database. The busy timeout comes
+        # from timeout=30.0 above.
         conn.execute('PRAGMA synchronous=NORMAL')
-        conn.execute('PRAGMA cache_size=10000')
+        # 64 MB page cache, kept warm because the connection is reused
+        conn.execute('PRAGMA cache_size=-65536')
         conn.execute('PRAGMA temp_store=memory')
+        # Read pages through a 256 MB memory map instead of read() calls
+        conn.execute('PRAGMA mmap_size=268435456')
+        # Cap the rows ANALYZE samples per index when PRAGMA optimize runs
+        conn.execute('PRAGMA analysis_limit=1000')
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log every statement, to see what a page actually runs
+            conn.set_trace_callback(logger.debug)
         return conn
     
+    def optimize_database(self):
+        """Let SQLite refresh the statistics the query planner relies on"""
+        try:
+            conn = self.open_db_connection()
+            conn.execute('PRAGMA optimize')
+            conn.discard()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not optimize database: {e}")
+    
+    def execute_write(self, *statements):
+        """Run (sql, params) statements on the writer thread and wait for them
+        
+        The statements run together (all or none) and the rowcount of each is
+        returned; an error raised by any of them is re-raised here.
+        """
+        item = {'statements': statements, 'done': threading.Event()}
+        self._write_queue.put(item)
+        item['done'].wait()
+        if 'error' in item:
+            raise item['error']
+        return item['rowcounts']
+    
+    def _writer_loop(self):
+        """Apply queued writes, one transaction per batch of waiting requests"""
+        conn = None
+        while True:
+            batch = [self._write_queue.get()]
+            # Whatever queued up while the last batch was committing rides
+            # along in this transaction
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                if conn is None:
+                    conn = self.open_db_connection()
+                    conn.isolation_level = None
+                conn.execute('BEGIN IMMEDIATE')
+                for item in batch:
+                    # A savepoint per request, so one failing write doesn't
+                    # undo the others in the batch
+                    conn.execute('SAVEPOINT request_write')
+                    try:
+                        item['rowcounts'] = [conn.execute(sql, params).rowcount
+                                             for sql, params in item['statements']]
+                    except Exception as e:
+                        conn.execute('ROLLBACK TO request_write')
+                        item['error'] = e
+                    conn.execute('RELEASE request_write')
+                conn.execute('COMMIT')
+            except Exception as e:
+                logger.error(f"Error committing queued writes: {e}")
+                if conn is not None and conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                for item in batch:
+                    item.setdefault('error', e)
+            
+            for item in batch:
+                item['done'].set()
+    
+    def article_keyword_match(self, keywords, alias='a'):
+        """Build the SQL pieces that restrict articles to ones mentioning any keyword.
+        
+        Returns (join, where, order, params). With FTS5 the match runs against
+        articles_fts and results can be ordered by bm25, with title hits
+        weighted ten times description hits; without it this falls back to
+        LIKE scans over title and description, newest first.
+        
+        The FTS hits are collected in a subquery that SQLite materializes
+        (OFFSET keeps it from being flattened), so date and event filters in
+        the outer query can't make the planner drive the search from another
+        index and re-run MATCH for every candidate row.
+        
+        Empty keywords are ignored; with none left the pieces match no
+        articles, since an empty MATCH is an FTS5 syntax error and an empty
+        LIKE pattern would match everything.
+        """
+        keywords = [keyword for keyword in keywords if keyword.replace('"', '').strip()]
+        if not keywords:
+            return '', '0', f'{alias}.published_date DESC', []
+        
+        if self.fts_enabled:
+            # Quote each keyword so punctuation like "wi-fi" or "802.11" is
+            # read as a phrase, and match it as a prefix
+            phrases = []
+            for keyword in keywords:
+                keyword = keyword.replace('"', '').strip()
+                phrases.append(f'"{keyword}"*')
+            return (f'''JOIN (
+                        SELECT rowid AS id, bm25(articles_fts, 10.0, 1.0) AS score
+                        FROM articles_fts WHERE articles_fts MATCH ?
+                        LIMIT -1 OFFSET 0
+                    ) fts ON fts.id = {alias}.id''',
+                    '1',  # the MATCH is applied inside the join
+                    'fts.score',
+                    [' OR '.join(phrases)])
+        
+        # LIKE already ignores ASCII case, so the columns are compared as
+        # stored instead of paying for LOWER() on every row
+        conditions = []
+        params = []
+        for keyword in keywords:
+            conditions.append(f"({alias}.title LIKE ? OR {alias}.description LIKE ?)")
+            params.extend([f'%{keyword}%', f'%{keyword}%'])
+        return '', '(' + ' OR '.join(conditions) + ')', f'{alias}.published_date DESC', params
+    
+    def get_cached_feeds(self):
+        """Return the feed list for the admin page, loading it on first use"""
+        with self._feeds_cache_lock:
+            if self._feeds_cache is None:
+                conn = self.get_db_connection()
+                rows = conn.execute('SELECT * FROM rss_feeds ORDER BY name').fetchall()
+                conn.close()
+                self._feeds_cache = [dict(row) for row in rows]
+            return self._feeds_cache
+    
+    def get_recent_insight_articles(self):
+        """Return the last week's relevant articles for insights, cached for 60 seconds"""
+        since = days_ago(7)
+        with self._recent_articles_lock:
+            cached = self._recent_articles_cache
+            if cached and cached[1] == since and time.time() - cached[0] < 60:
+                return cached[2]
+            
+            conn = self.get_db_connection()
+            rows = conn.execute('''
+                SELECT a.id, a.title, a.url, a.description, a.published_date, a.relevance_score,
+                       f.name as feed_name 
+                FROM articles a 
+                JOIN rss_feeds f ON a.feed_id = f.id
+                WHERE a.published_date >= ?
+                AND a.relevance_score > 0.2
+                ORDER BY a.published_date DESC
+                LIMIT 50
+            ''', (since,)).fetchall()
+            conn.close()
+            # Insights and trends both scan the same text, so build it once
+            rows = with_search_text(rows)
+            self._recent_articles_cache = (time.time(), since, rows)
+            return rows
+    
+    def remove_feed(self, conn, feed_id):
+        """Delete a feed and, through its trigger, its articles; returns how
+        many articles went with it"""
+        articles_deleted = conn.execute(
+            'SELECT COUNT(*) FROM articles WHERE feed_id = ?', (feed_id,)
+        ).fetchone()[0]
+        conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
+        conn.commit()
+        self.invalidate_feeds_cache()
+        self.invalidate_index_cache()
+        return articles_deleted
+    
+    def page_cache_key(self, allowed_args):
+        """Cache key for the current request's rendered page, or None.
+        
+        Templates echo the query string back into links, so the key is the
+        whole query string, and only requests whose args all appear in
+        allowed_args with one of the listed values are cached. That keeps a
+        crafted URL from being served to other visitors and bounds the
+        number of cached pages. Visitors with flash messages waiting are
+        never served from or stored in the cache.
+        """
+        if session.get('_flashes'):
+            return None
+        args = tuple(sorted(request.args.items(multi=True)))
+        for name, value in args:
+            if value not in allowed_args.get(name, ()):
+                return None
+        return args
+    
+    def invalidate_index_cache(self):
+        """Drop rendered dashboard pages after articles have changed"""
+        with self._index_page_lock:
+            self._index_page_cache.clear()
+    
+    def invalidate_events_cache(self):
+        """Drop rendered events pages after industry_events has changed"""
+        with self._events_page_lock:
+            self._events_page_cache.clear()
+    
+    def invalidate_feeds_cache(self):
+        """Drop the cached feed list after rss_feeds has been written to"""
+        with self._feeds_cache_lock:
+            self._feeds_cache = None
+    
     def setup_routes(self):
         """Setup Flask routes"""
         
+        @self.app.teardown_appcontext
+        def release_db_connections(exc):
+            # Only close checkouts this request still owns; a connection it already
+            # returned may since have been handed to another thread
+            for conn, checkout in g.pop('db_connections', []):
+                if conn.checked_out and conn.checkout == checkout:
+                    conn.close()
+        
+        @self.app.before_request
+        def load_view_mode():
+            # Layout chosen with ?view=, read once for the route and redirects
+            g.view_mode = request.args.get('view', 'newspaper')
+        
         @self.app.route('/')
         def index():
-            conn = self.get_db_connection()
-            
-            # Get view mode from query parameter (default to newspaper)
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             show_all = request.args.get('show_all', 'false').lower() == 'true'
             
-            # Get current date for filtering
-            today = datetime.now().strftime('%Y-%m-%d')
+            # Resolve "today" once and derive every window from it, so the
+            # queries compare plain ISO strings and can't straddle midnight.
+            # It is the UTC day, as date('now') is for the events page
+            today_date = utc_today()
+            today = today_date.isoformat()
+            
+            # Every visitor sees the same page, so serve a recent rendering
+            # when the request can share one
+            page_key = self.page_cache_key({'view': VIEW_MODES, 'show_all': ('true', 'false')})
+            cache_key = (page_key, today)
+            cacheable = page_key is not None
+            if cacheable:
+                with self._index_page_lock:
+                    cached = self._index_page_cache.get(cache_key)
+                if cached and time.time() - cached[0] < 30:
+                    return cached[1]
             
+            conn = self.get_db_connection()
+            week_cutoff = (today_date - timedelta(days=7)).isoformat()
+            five_day_cutoff = (today_date - timedelta(days=5)).isoformat()
+            # Events starting within the next two weeks or that ended in the
+            # last five days, as half-open ranges so a date with a time part
+            # on the last day still counts
+            event_window = (*date_bounds(today_date, today_date + timedelta(days=14)),
+                            *date_bounds(five_day_cutoff, today_date))
+            
+            # Each article is listed once, with the active event it is most
+            # relevant to (if any), so the LIMIT counts distinct stories
             if show_all:
                 # Show all articles from the last 5 days regardless of relevance, plus active event articles
                 stories_raw = conn.execute('''
-                    SELECT a.*, f.name as feed_name, f.url as feed_url,
-                           ie.name as event_name, ie.id as event_id, ea.relevance_score as event_relevance
-                    FROM articles a 
-                    JOIN rss_feeds f ON a.feed_id = f.id
-                    LEFT JOIN event_articles ea ON a.id = ea.article_id
-                    LEFT JOIN industry_events ie ON ea.event_id = ie.id AND ie.active = 1
+                    WITH article_events AS (
+                        SELECT ea.article_id, ie.name AS event_name, ie.id AS event_id,
+                               ea.relevance_score AS event_relevance,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY ea.article_id ORDER BY ea.relevance_score DESC
+                               ) AS event_rank
+                        FROM event_articles ea
+                        JOIN industry_events ie ON ea.event_id = ie.id
+                        WHERE ie.active = 1
                         AND (
-                            (date(ie.start_date) BETWEEN date('now') AND date('now', '+14 days'))
+                            (ie.start_date >= ? AND ie.start_date < ?)
                             OR 
-                            (date(ie.end_date) BETWEEN date('now', '-5 days') AND date('now'))
+                            (ie.end_date >= ? AND ie.end_date < ?)
                         )
-                    WHERE (DATE(a.published_date) >= DATE('now', '-7 days') OR ie.name IS NOT NULL)
+                    )
+                    SELECT a.*, f.name as feed_name, f.url as feed_url,
+                           ae.event_name, ae.event_id, ae.event_relevance
+                    FROM articles a 
+                    JOIN rss_feeds f ON a.feed_id = f.id
+                    LEFT JOIN article_events ae ON ae.article_id = a.id AND ae.event_rank = 1
+                    WHERE (a.published_date >= ? OR ae.event_name IS NOT NULL)
                     ORDER BY a.relevance_score DESC, a.published_date DESC
                     LIMIT 100
-                ''').fetchall()
+                ''', event_window + (week_cutoff,)).fetchall()
             else:
                 # Get top articles from last 5 days plus active event articles
                 top_stories_raw = conn.execute('''
-                    SELECT a.*, f.name as feed_name, f.url as feed_url,
-                           ie.name as event_name, ie.id as event_id, ea.relevance_score as event_relevance
-                    FROM articles a 
-                    JOIN rss_feeds f ON a.feed_id = f.id
-                    LEFT JOIN event_articles ea ON a.id = ea.article_id
-                    LEFT JOIN industry_events ie ON ea.event_id = ie.id AND ie.active = 1
+                    WITH article_events AS (
+                        SELECT ea.article_id, ie.name AS event_name, ie.id AS event_id,
+                               ea.relevance_score AS event_relevance,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY ea.article_id ORDER BY ea.relevance_score DESC
+                               ) AS event_rank
+                        FROM event_articles ea
+                        JOIN industry_events ie ON ea.event_id = ie.id
+                        WHERE ie.active = 1
                         AND (
-                            (date(ie.start_date) BETWEEN date('now') AND date('now', '+14 days'))
+                            (ie.start_date >= ? AND ie.start_date < ?)
                             OR 
-                            (date(ie.end_date) BETWEEN date('now', '-5 days') AND date('now'))
+                            (ie.end_date >= ? AND ie.end_date < ?)
                         )
-                    WHERE (DATE(a.published_date) >= DATE('now', '-7 days') AND a.relevance_score > 0.05) OR ie.name IS NOT NULL
+                    )
+                    SELECT a.*, f.name as feed_name, f.url as feed_url,
+                           ae.event_name, ae.event_id, ae.event_relevance
+                    FROM articles a 
+                    JOIN rss_feeds f ON a.feed_id = f.id
+                    LEFT JOIN article_events ae ON ae.article_id = a.id AND ae.event_rank = 1
+                    WHERE (a.published_date >= ? AND a.relevance_score > 0.05) OR ae.event_name IS NOT NULL
                     ORDER BY a.relevance_score DESC, a.published_date DESC
                     LIMIT 50
-                ''').fetchall()
+                ''', event_window + (week_cutoff,)).fetchall()
                 
                 # Use the top stories directly (already from 5 days)
                 stories_raw = top_stories_raw
             
-            # Convert Row objects to dictionaries for JSON serialization
-            stories = []
-            for row in stories_raw:
-                story_dict = dict(row)
-                # Ensure datetime objects are converted to strings for JSON serialization
-                if 'published_date' in story_dict and story_dict['published_date']:
-                    if isinstance(story_dict['published_date'], datetime):
-                        story_dict['published_date'] = story_dict['published_date'].isoformat()
-                if 'created_at' in story_dict and story_dict['created_at']:
-                    if isinstance(story_dict['created_at'], datetime):
-                        story_dict['created_at'] = story_dict['created_at'].isoformat()
-                stories.append(story_dict)
-            
-            # Get total article count for the last 5 days for Show All button
-            total_articles = conn.execute('''
-                SELECT COUNT(*) FROM articles 
-                WHERE DATE(published_date) >= DATE('now', '-5 days')
-            ''').fetchone()[0]
-            
-            # Get count of relevant articles for comparison
-            relevant_articles = conn.execute('''
-                SELECT COUNT(*) FROM articles 
-                WHERE DATE(published_date) >= DATE('now', '-5 days') AND relevance_score > 0.2
-            ''').fetchone()[0]
+            # Jinja reads sqlite3.Row columns by key, and timestamps come back
+            # as strings (no detect_types), so the rows can be rendered as-is
+            stories = stories_raw
+            
+            # Article counts for the last 5 days for the Show All button: all of
+            # them, and the relevant ones for comparison, in one index range scan
+            total_articles, relevant_articles = conn.execute('''
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE relevance_score > 0.2)
+                FROM articles 
+                WHERE published_date >= ?
+            ''', (five_day_cutoff,)).fetchone()
             
             conn.close()
-            return render_template('index.html', 
+            page = render_template('index.html', 
                                  stories=stories, 
                                  date=today, 
                                  view_mode=view_mode, 
                                  show_all=show_all, 
                                  total_articles=total_articles,
                                  relevant_articles=relevant_articles)
+            if cacheable:
+                with self._index_page_lock:
+                    self._index_page_cache[cache_key] = (time.time(), page)
+            return page
         
         @self.app.route('/image_gallery')
         def image_gallery():
             """Show gallery of all generated images"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             conn = self.get_db_connection()
             
-            # Get all articles with images
-            images_raw = conn.execute('''
+            # Get all articles with images. Rows go to the template as-is;
+            # Jinja reads image.column through the row's own lookup
+            images = conn.execute('''
                 SELECT a.id, a.title, a.image_url, a.created_at, f.name as feed_name, a.url
                 FROM articles a
                 JOIN rss_feeds f ON a.feed_id = f.id
@@ -502,9 +1370,6 @@ class WirelessMonitor:
                 ORDER BY a.created_at DESC
             ''').fetchall()
             
-            # Convert to dictionaries
-            images = [dict(row) for row in images_raw]
-            
             # Count scraped vs AI generated
             scraped_count = sum(1 for img in images if '/static/generated_images/' not in img['image_url'])
             ai_generated_count = sum(1 for img in images if '/static/generated_images/' in img['image_url'])
@@ -519,107 +1384,132 @@ class WirelessMonitor:
 
         @self.app.route('/feeds')
         def manage_feeds():
-            conn = self.get_db_connection()
-            feeds = conn.execute('SELECT * FROM rss_feeds ORDER BY name').fetchall()
-            view_mode = request.args.get('view', 'newspaper')
-            conn.close()
+            feeds = self.get_cached_feeds()
+            view_mode = g.view_mode
             return render_template('feeds.html', feeds=feeds, view_mode=view_mode)
         
         @self.app.route('/add_feed', methods=['POST'])
         def add_feed():
             name = request.form['name']
             url = request.form['url']
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
-            conn = self.get_db_connection()
             try:
-                conn.execute('INSERT INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', (name, url))
-                conn.commit()
+                self.execute_write(('INSERT INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', (name, url)))
+                self.invalidate_feeds_cache()
                 flash(f'Successfully added feed: {name}', 'success')
             except sqlite3.IntegrityError:
                 flash(f'Feed URL already exists: {url}', 'error')
-            finally:
-                conn.close()
             
-            return redirect(url_for('manage_feeds', view=view_mode))
+            return redirect(url_for('manage_feeds', view=view_mode), code=303)
         
         @self.app.route('/add_google_news', methods=['POST'])
         def add_google_news():
             keyword = request.form['keyword'].strip()
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             if not keyword:
                 flash('Please enter a keyword', 'error')
-                return redirect(url_for('manage_feeds', view=view_mode))
+                return redirect(url_for('manage_feeds', view=view_mode), code=303)
             
             # Create Google News RSS URL
             google_news_url = f"https://news.google.com/news/rss/search?q={keyword}&hl=en"
             feed_name = f"Google News: {keyword}"
             
-            conn = self.get_db_connection()
             try:
-                conn.execute('INSERT INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', (feed_name, google_news_url))
-                conn.commit()
+                self.execute_write(('INSERT INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', (feed_name, google_news_url)))
+                self.invalidate_feeds_cache()
                 flash(f'Successfully added Google News feed for "{keyword}"', 'success')
             except sqlite3.IntegrityError:
                 flash(f'Google News feed for "{keyword}" already exists', 'error')
-            finally:
-                conn.close()
             
-            return redirect(url_for('manage_feeds', view=view_mode))
+            return redirect(url_for('manage_feeds', view=view_mode), code=303)
         
         @self.app.route('/bulk_import', methods=['POST'])
         def bulk_import():
             urls_text = request.form['urls']
             urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             conn = self.get_db_connection()
             added_count = 0
             error_count = 0
             
-            for url in urls:
+            # Feeds that are already stored would only fail the insert, so
+            # don't spend a download on them
+            existing = set()
+            if urls:
+                placeholders = ','.join('?' * len(set(urls)))
+                existing = {row['url'] for row in conn.execute(
+                    f'SELECT url FROM rss_feeds WHERE url IN ({placeholders})', list(set(urls))
+                )}
+            
+            def probe(url):
+                """Fetch a feed to get its title; returns (url, name, error)"""
                 try:
-                    # Try to fetch the feed to get its title
-                    response = requests.get(url, timeout=10)
-                    parsed_feed = feedparser.parse(response.content)
+                    response = self.http.get(url, timeout=10)
                     
                     # Use feed title or fallback to domain name
-                    if parsed_feed.feed.get('title'):
-                        name = parsed_feed.feed.title
-                    else:
-                        # Extract domain name as fallback
-                        domain = urlparse(url).netloc
-                        name = domain.replace('www.', '').title()
-                    
-                    # Insert into database
-                    conn.execute('INSERT INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', (name, url))
-                    added_count += 1
-                    
-                except sqlite3.IntegrityError:
-                    error_count += 1  # URL already exists
+                    title = feed_title(response.content)
+                    if title:
+                        return url, title, None
+                    # Extract domain name as fallback
+                    domain = urlparse(url).netloc
+                    return url, domain.replace('www.', '').title(), None
                 except Exception as e:
-                    logger.error(f"Error processing URL {url}: {e}")
+                    return url, None, e
+            
+            # The downloads are network-bound, so run them side by side and
+            # keep the inserts on this thread
+            to_probe = list(dict.fromkeys(url for url in urls if url not in existing))
+            probed = {}
+            if to_probe:
+                with ThreadPoolExecutor(max_workers=min(FEED_FETCH_WORKERS, len(to_probe))) as executor:
+                    for url, name, error in executor.map(probe, to_probe):
+                        probed[url] = (name, error)
+            
+            to_insert = []
+            for url in urls:
+                if url in existing:
+                    error_count += 1  # URL already exists
+                    continue
+                name, error = probed[url]
+                if error is not None:
+                    logger.error(f"Error processing URL {url}: {error}")
                     error_count += 1
+                    continue
+                to_insert.append((name, url))
+            
+            if to_insert:
+                # A URL listed twice is skipped by the UNIQUE index
+                added_count = conn.executemany(
+                    'INSERT OR IGNORE INTO rss_feeds (name, url, active) VALUES (?, ?, 1)', to_insert
+                ).rowcount
+                error_count += len(to_insert) - added_count
             
             conn.commit()
             conn.close()
             
             if added_count > 0:
+                self.invalidate_feeds_cache()
                 flash(f'Successfully added {added_count} RSS feeds', 'success')
             if error_count > 0:
                 flash(f'{error_count} feeds could not be added (duplicates or invalid URLs)', 'error')
             
-            return redirect(url_for('manage_feeds', view=view_mode))
+            return redirect(url_for('manage_feeds', view=view_mode), code=303)
         
         @self.app.route('/toggle_feed/<int:feed_id>')
         def toggle_feed(feed_id):
-            conn = self.get_db_connection()
-            conn.execute('UPDATE rss_feeds SET active = CASE WHEN active = 1 THEN 0 ELSE 1 END WHERE id = ?', (feed_id,))
-            conn.commit()
-            conn.close()
-            view_mode = request.args.get('view', 'newspaper')
-            return redirect(url_for('manage_feeds', view=view_mode))
+            view_mode = g.view_mode
+            # Flip the flag in SQL so concurrent toggles can't lose an update
+            updated, = self.execute_write(
+                ('UPDATE rss_feeds SET active = CASE WHEN active = 1 THEN 0 ELSE 1 END WHERE id = ?', (feed_id,)))
+            if not updated:
+                flash('Feed not found', 'error')
+                return redirect(url_for('manage_feeds', view=view_mode), code=303)
+            
+            self.invalidate_feeds_cache()
+            return redirect(url_for('manage_feeds', view=view_mode), code=303)
         
         @self.app.route('/delete_feed/<int:feed_id>', methods=['POST'])
         def delete_feed(feed_id):
@@ -627,21 +1517,24 @@ class WirelessMonitor:
             try:
                 conn = self.get_db_connection()
                 
-                # Get feed name for logging
-                feed = conn.execute('SELECT name FROM rss_feeds WHERE id = ?', (feed_id,)).fetchone()
+                # Get feed name and article count for logging
+                feed = conn.execute('''
+                    SELECT name, (SELECT COUNT(*) FROM articles WHERE feed_id = rss_feeds.id) AS article_count
+                    FROM rss_feeds WHERE id = ?
+                ''', (feed_id,)).fetchone()
                 if not feed:
+                    conn.close()
                     flash('Feed not found', 'error')
-                    return redirect(url_for('manage_feeds', view=request.args.get('view', 'newspaper')))
+                    return redirect(url_for('manage_feeds', view=g.view_mode), code=303)
                 
-                # Delete articles from this feed first (foreign key constraint)
-                articles_deleted = conn.execute('DELETE FROM articles WHERE feed_id = ?', (feed_id,)).rowcount
-                
-                # Delete the feed
-                conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
-                
-                conn.commit()
                 conn.close()
                 
+                # The rss_feeds_delete_articles trigger removes the articles
+                self.execute_write(('DELETE FROM rss_feeds WHERE id = ?', (feed_id,)))
+                articles_deleted = feed['article_count']
+                self.invalidate_feeds_cache()
+                self.invalidate_index_cache()
+                
                 flash(f'Successfully deleted feed "{feed["name"]}" and {articles_deleted} associated articles', 'success')
                 logger.info(f"Deleted RSS feed: {feed['name']} (ID: {feed_id}) with {articles_deleted} articles")
                 
@@ -649,20 +1542,28 @@ class WirelessMonitor:
                 flash(f'Error deleting feed: {str(e)}', 'error')
                 logger.error(f"Error deleting feed {feed_id}: {e}")
             
-            view_mode = request.args.get('view', 'newspaper')
-            return redirect(url_for('manage_feeds', view=view_mode))
+            view_mode = g.view_mode
+            return redirect(url_for('manage_feeds', view=view_mode), code=303)
         
         @self.app.route('/admin')
         def admin():
             conn = self.get_db_connection()
+            # All dashboard counts in one statement; each subquery still uses
+            # its own index, and feeds are counted in a single pass
+            counts = conn.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM articles) AS total_articles,
+                    feeds.total AS total_feeds,
+                    feeds.active AS active_feeds,
+                    (SELECT COUNT(*) FROM articles
+                     WHERE published_date >= ? AND published_date < ?) AS articles_today,
+                    (SELECT COUNT(*) FROM industry_events WHERE active = 1) AS total_events,
+                    (SELECT COUNT(*) FROM wild_wifi_stories) AS total_wild_stories,
+                    (SELECT COUNT(*) FROM weekly_digest) AS digest_articles
+                FROM (SELECT COUNT(*) AS total, COALESCE(SUM(active = 1), 0) AS active FROM rss_feeds) AS feeds
+            ''', date_bounds(utc_today(), utc_today())).fetchone()
             stats = {
-                'total_articles': conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0],
-                'total_feeds': conn.execute('SELECT COUNT(*) FROM rss_feeds').fetchone()[0],
-                'active_feeds': conn.execute('SELECT COUNT(*) FROM rss_feeds WHERE active = 1').fetchone()[0],
-                'articles_today': conn.execute('SELECT COUNT(*) FROM articles WHERE DATE(published_date) = DATE("now")').fetchone()[0],
-                'total_events': conn.execute('SELECT COUNT(*) FROM industry_events WHERE active = 1').fetchone()[0],
-                'total_wild_stories': conn.execute('SELECT COUNT(*) FROM wild_wifi_stories').fetchone()[0],
-                'digest_articles': conn.execute('SELECT COUNT(*) FROM weekly_digest').fetchone()[0],
+                **dict(counts),
                 'generated_images': len([f for f in os.listdir('static/generated_images') if f.endswith('.png')]) if os.path.exists('static/generated_images') else 0,
             }
             
@@ -691,7 +1592,7 @@ class WirelessMonitor:
                     'uptime': time.time() - self.start_time if hasattr(self, 'start_time') else 0
                 }
             
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             conn.close()
             return render_template('admin.html', stats=stats, system_info=system_info, view_mode=view_mode)
         
@@ -793,41 +1694,26 @@ class WirelessMonitor:
                 current_user = os.getenv('USER', 'wifi')
                 project_dir = f'/home/{current_user}/wireless_monitor'
                 
-                # First, stash any local changes
-                stash_result = subprocess.run(['git', 'stash', 'push', '-m', 'Auto-stash before update'], 
-                                            cwd=project_dir, 
-                                            capture_output=True, 
-                                            text=True, 
-                                            timeout=30)
-                
-                # Pull latest changes
-                result = subprocess.run(['git', 'pull', 'origin', 'main'], 
+                # Pull latest changes in a single git run; --autostash sets
+                # local changes aside and reapplies them after the merge
+                result = subprocess.run(['git', 'pull', '--autostash', '--no-rebase', 'origin', 'main'], 
                                       cwd=project_dir, 
                                       capture_output=True, 
                                       text=True, 
-                                      timeout=30)
+                                      timeout=60)
                 
                 if result.returncode == 0:
-                    # Try to restore stashed changes if there were any
-                    if 'No local changes to save' not in stash_result.stdout:
-                        # There were changes stashed, try to apply them
-                        pop_result = subprocess.run(['git', 'stash', 'pop'], 
-                                                  cwd=project_dir, 
-                                                  capture_output=True, 
-                                                  text=True, 
-                                                  timeout=30)
-                        
-                        if pop_result.returncode != 0:
-                            # Stash pop failed, keep the stash for manual resolution
-                            message = f'Update successful but local changes were stashed. Check "git stash list" for your changes. {result.stdout}'
-                        else:
-                            message = f'Update successful and local changes restored. {result.stdout}'
+                    output = result.stdout + result.stderr
+                    if 'Your changes are safe in the stash' in output:
+                        # Reapplying conflicted, git keeps the stash for manual resolution
+                        message = f'Update successful but local changes were stashed. Check "git stash list" for your changes. {result.stdout}'
+                    elif 'Created autostash' in output:
+                        message = f'Update successful and local changes restored. {result.stdout}'
                     else:
                         message = f'Update successful. {result.stdout}'
                     
-                    # Restart service after update
-                    subprocess.run(['sudo', 'systemctl', 'restart', 'wireless-monitor'], 
-                                 timeout=10)
+                    # Restart service after update, once this response is out
+                    self.restart_service()
                     
                     return jsonify({
                         'success': True, 
@@ -885,25 +1771,43 @@ class WirelessMonitor:
         @self.app.route('/events')
         def events():
             """Show current industry events"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
+            
+            # Events change a few times a day at most, so serve a recent
+            # rendering when the request can share one. The list depends on
+            # date('now'), so the key uses the same UTC day
+            page_key = self.page_cache_key({'view': VIEW_MODES})
+            cache_key = (page_key, utc_today().isoformat())
+            cacheable = page_key is not None
+            if cacheable:
+                with self._events_page_lock:
+                    cached = self._events_page_cache.get(cache_key)
+                if cached and time.time() - cached[0] < 120:
+                    return cached[1]
             
             conn = self.get_db_connection()
             
-            # Get active events (upcoming or currently happening)
+            # Get active events (upcoming or currently happening). end_date is
+            # compared as ISO text without wrapping it in date(); a value with
+            # a time part on today's date still sorts at or after today
             current_events = conn.execute('''
                 SELECT * FROM industry_events 
                 WHERE active = 1 
-                AND date(end_date) >= date('now')
+                AND end_date >= date('now')
                 ORDER BY start_date
             ''').fetchall()
             
             conn.close()
-            return render_template('events.html', events=current_events, view_mode=view_mode)
+            page = render_template('events.html', events=current_events, view_mode=view_mode)
+            if cacheable:
+                with self._events_page_lock:
+                    self._events_page_cache[cache_key] = (time.time(), page)
+            return page
         
         @self.app.route('/event/<int:event_id>')
         def event_detail(event_id):
             """Show detailed view of a specific event with related articles"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             conn = self.get_db_connection()
             
@@ -915,7 +1819,8 @@ class WirelessMonitor:
             
             # Get event-related articles
             event_articles_raw = conn.execute('''
-                SELECT a.*, f.name as feed_name, f.url as feed_url, ea.relevance_score as event_relevance
+                SELECT a.id, a.title, a.url, a.description, a.content, a.published_date, a.relevance_score,
+                       f.name as feed_name, f.url as feed_url, ea.relevance_score as event_relevance
                 FROM event_articles ea
                 JOIN articles a ON ea.article_id = a.id
                 JOIN rss_feeds f ON a.feed_id = f.id
@@ -928,38 +1833,33 @@ class WirelessMonitor:
             event_articles = [dict(row) for row in event_articles_raw]
             
             # Get recent articles that might be related to the event
-            hashtags = event['hashtags'].split(',') if event['hashtags'] else []
-            keywords = [tag.replace('#', '').lower() for tag in hashtags[:5]]  # Use first 5 hashtags as keywords
+            keywords = list(event_keywords(event['hashtags'])[:5])  # Use first 5 hashtags as keywords
+            window = date_bounds(event['start_date'], event['end_date'], 3, 3)
             
-            if keywords:
-                # Use LIKE instead of REGEXP for SQLite compatibility
-                like_conditions = []
-                params = []
-                for keyword in keywords[:5]:
-                    like_conditions.append("(LOWER(a.title) LIKE ? OR LOWER(a.description) LIKE ?)")
-                    params.extend([f'%{keyword}%', f'%{keyword}%'])
+            if keywords and window:
+                # Rank candidates by full-text relevance to the event keywords
+                match_join, match_where, match_order, params = self.article_keyword_match(keywords[:5])
                 
-                where_clause = " OR ".join(like_conditions)
-                
-                recent_articles_raw = conn.execute(f'''
-                    SELECT a.*, f.name as feed_name, f.url as feed_url
+                recent_articles = conn.execute(f'''
+                    SELECT a.id, a.title, a.url, a.description, a.published_date, a.relevance_score,
+                           f.name as feed_name, f.url as feed_url
                     FROM articles a
+                    {match_join}
                     JOIN rss_feeds f ON a.feed_id = f.id
-                    WHERE ({where_clause})
-                    AND DATE(a.published_date) >= DATE(?, '-3 days')
-                    AND DATE(a.published_date) <= DATE(?, '+3 days')
-                    AND a.id NOT IN (SELECT article_id FROM event_articles WHERE event_id = ?)
-                    ORDER BY a.published_date DESC
+                    WHERE {match_where}
+                    AND a.published_date >= ? AND a.published_date < ?
+                    AND NOT EXISTS (
+                        SELECT 1 FROM event_articles ea WHERE ea.event_id = ? AND ea.article_id = a.id
+                    )
+                    ORDER BY {match_order}
                     LIMIT 20
-                ''', params + [event['start_date'], event['end_date'], event_id]).fetchall()
-                
-                recent_articles = [dict(row) for row in recent_articles_raw]
+                ''', params + [*window, event_id]).fetchall()
             else:
                 recent_articles = []
             
             conn.close()
             return render_template('event_detail.html', 
-                                 event=dict(event), 
+                                 event=event, 
                                  event_articles=event_articles,
                                  recent_articles=recent_articles,
                                  view_mode=view_mode)
@@ -976,8 +1876,9 @@ class WirelessMonitor:
                     return jsonify({'success': False, 'error': 'Event not found'})
                 
                 # Use AI to search for event content
-                articles_found = self.ai_search_event_content(event)
+                articles_found = self.ai_search_event_content(event, conn)
                 
+                conn.commit()
                 conn.close()
                 return jsonify({
                     'success': True, 
@@ -1001,11 +1902,13 @@ class WirelessMonitor:
                     ORDER BY start_date
                 ''').fetchall()
                 
+                # Search every event on this one connection and commit once
                 total_articles = 0
                 for event in events:
-                    articles_found = self.ai_search_event_content(event)
+                    articles_found = self.ai_search_event_content(event, conn)
                     total_articles += articles_found
                 
+                conn.commit()
                 conn.close()
                 return jsonify({
                     'success': True, 
@@ -1024,6 +1927,8 @@ class WirelessMonitor:
                 
                 # Run event detection
                 self.detect_new_events_from_articles(conn)
+                self.invalidate_events_cache()
+                self.invalidate_index_cache()
                 
                 # Get newly detected events
                 recent_events = conn.execute('''
@@ -1053,54 +1958,57 @@ class WirelessMonitor:
                 events = conn.execute('''
                     SELECT * FROM industry_events 
                     WHERE active = 1 
-                    AND date(start_date) <= date('now', '+14 days')
-                    AND date(end_date) >= date('now', '-7 days')
+                    AND start_date < date('now', '+15 days')
+                    AND end_date >= date('now', '-7 days')
                 ''').fetchall()
                 
                 total_categorized = 0
                 
                 for event in events:
                     # Get hashtags/keywords for this event
-                    hashtags = event['hashtags'].split(',') if event['hashtags'] else []
-                    keywords = [tag.replace('#', '').lower().strip() for tag in hashtags]
+                    keywords = event_keywords(event['hashtags'])
                     
-                    if not keywords:
+                    # An event with a malformed date has no window to search
+                    window = date_bounds(event['start_date'], event['end_date'], 3, 7)
+                    if not keywords or not window:
                         continue
+                    # One automaton pass per text instead of a scan per keyword
+                    matcher = keyword_matcher(keywords)
+                    
+                    # Fetch the unlinked articles in the event window that mention
+                    # any keyword in one query, then score them in Python
+                    match_join, match_where, _, params = self.article_keyword_match(keywords[:10])  # Limit to first 10 keywords
+                    articles = conn.execute(f'''
+                        SELECT a.id, LOWER(a.title) AS lt, LOWER(COALESCE(a.description, '')) AS ld
+                        FROM articles a
+                        {match_join}
+                        WHERE {match_where}
+                        AND a.published_date >= ? AND a.published_date < ?
+                        AND NOT EXISTS (
+                            SELECT 1 FROM event_articles ea WHERE ea.event_id = ? AND ea.article_id = a.id
+                        )
+                    ''', params + [*window, event['id']]).fetchall()
                     
-                    # Find articles that match event keywords
-                    for keyword in keywords[:10]:  # Limit to first 10 keywords
-                        articles = conn.execute('''
-                            SELECT id, title, description, relevance_score
-                            FROM articles
-                            WHERE (LOWER(title) LIKE ? OR LOWER(description) LIKE ?)
-                            AND DATE(published_date) >= DATE(?, '-3 days')
-                            AND DATE(published_date) <= DATE(?, '+7 days')
-                            AND id NOT IN (SELECT article_id FROM event_articles WHERE event_id = ?)
-                        ''', (f'%{keyword}%', f'%{keyword}%', event['start_date'], event['end_date'], event['id'])).fetchall()
+                    links = []
+                    for article in articles:
+                        title, desc = article['lt'], article['ld']
                         
-                        for article in articles:
-                            # Calculate event relevance score
-                            title_matches = sum(1 for kw in keywords if kw in article['title'].lower())
-                            desc_matches = sum(1 for kw in keywords if kw in (article['description'] or '').lower())
-                            
-                            event_relevance = min((title_matches * 0.3 + desc_matches * 0.2) / len(keywords), 1.0)
-                            
-                            if event_relevance > 0.1:  # Only add if somewhat relevant
-                                # Check if already exists
-                                existing = conn.execute('''
-                                    SELECT id FROM event_articles 
-                                    WHERE event_id = ? AND article_id = ?
-                                ''', (event['id'], article['id'])).fetchone()
-                                
-                                if not existing:
-                                    conn.execute('''
-                                        INSERT INTO event_articles (event_id, article_id, relevance_score)
-                                        VALUES (?, ?, ?)
-                                    ''', (event['id'], article['id'], event_relevance))
-                                    total_categorized += 1
+                        # Calculate event relevance score
+                        title_matches = count_keyword_matches(keywords, title, matcher)
+                        desc_matches = count_keyword_matches(keywords, desc, matcher)
+                        
+                        event_relevance = min((title_matches * 0.3 + desc_matches * 0.2) / len(keywords), 1.0)
+                        
+                        if event_relevance > 0.1:  # Only add if somewhat relevant
+                            links.append((event['id'], article['id'], event_relevance))
+                    
+                    if links:
+                        total_categorized += conn.executemany(SQL_LINK_EVENT_ARTICLE, links).rowcount
                 
                 conn.commit()
                 conn.close()
+                self.invalidate_events_cache()
+                self.invalidate_index_cache()
                 
                 return jsonify({'success': True, 'categorized': total_categorized})
                 
@@ -1130,7 +2038,7 @@ class WirelessMonitor:
                 # Check if event already exists
                 existing = conn.execute('''
                     SELECT id, name FROM industry_events 
-                    WHERE LOWER(name) LIKE ? OR LOWER(name) LIKE ?
+                    WHERE name LIKE ? OR name LIKE ?
                 ''', (f"%{event_name.lower()}%", f"%{event_name.lower().replace(str(year), '').strip()}%")).fetchone()
                 
                 if existing:
@@ -1173,6 +2081,8 @@ class WirelessMonitor:
                 
                 conn.commit()
                 conn.close()
+                self.invalidate_events_cache()
+                self.invalidate_index_cache()
                 
                 logger.info(f"Manually added event: {event_name} (ID: {event_id}) with {articles_found} articles")
                 
@@ -1221,6 +2131,8 @@ class WirelessMonitor:
                 
                 conn.commit()
                 conn.close()
+                self.invalidate_events_cache()
+                self.invalidate_index_cache()
                 
                 logger.info(f"Manually removed event: {event_name} (ID: {event_id}) with {articles_count} article associations")
                 
@@ -1248,26 +2160,29 @@ class WirelessMonitor:
                 
                 conn = self.get_db_connection()
                 
-                # Get article details
+                # Get the article and the platform's settings together; the
+                # settings columns are aliased so they can't collide with
+                # article columns
                 article = conn.execute('''
-                    SELECT a.*, f.name as feed_name 
+                    SELECT a.title, a.url, a.description, f.name as feed_name,
+                           sc.platform AS social_platform, sc.username AS social_username
                     FROM articles a 
                     JOIN rss_feeds f ON a.feed_id = f.id 
+                    LEFT JOIN social_config sc ON sc.platform = ? AND sc.enabled = 1
                     WHERE a.id = ?
-                ''', (article_id,)).fetchone()
+                ''', (platform, article_id)).fetchone()
                 
                 if not article:
+                    conn.close()
                     return jsonify({'success': False, 'error': 'Article not found'})
                 
-                # Get social media configuration
-                social_config = conn.execute('''
-                    SELECT * FROM social_config 
-                    WHERE platform = ? AND enabled = 1
-                ''', (platform,)).fetchone()
-                
-                if not social_config:
+                if article['social_platform'] is None:
+                    conn.close()
                     return jsonify({'success': False, 'error': f'{platform} not configured or disabled'})
                 
+                social_config = {'platform': article['social_platform'],
+                                 'username': article['social_username']}
+                
                 # Generate share content
                 share_content = self.generate_share_content(article, social_config)
                 
@@ -1303,25 +2218,19 @@ class WirelessMonitor:
                 conn = self.get_db_connection()
                 
                 # Get current week start (Monday)
-                from datetime import datetime, timedelta
-                today = datetime.now().date()
-                week_start = today - timedelta(days=today.weekday())
+                today, week_start = current_week()
                 
-                # Check if article is already in this week's digest
-                existing = conn.execute('''
-                    SELECT id FROM weekly_digest 
-                    WHERE article_id = ? AND week_start = ?
-                ''', (article_id, week_start)).fetchone()
+                # Add to digest; the (week_start, article_id) index is unique,
+                # so an article already in this week's digest inserts nothing
+                added = conn.execute('''
+                    INSERT OR IGNORE INTO weekly_digest (article_id, notes, week_start)
+                    VALUES (?, ?, ?)
+                ''', (article_id, notes, week_start)).rowcount
                 
-                if existing:
+                if not added:
+                    conn.close()
                     return jsonify({'success': False, 'error': 'Article already in this week\'s digest'})
                 
-                # Add to digest
-                conn.execute('''
-                    INSERT INTO weekly_digest (article_id, notes, week_start)
-                    VALUES (?, ?, ?)
-                ''', (article_id, notes, week_start))
-                
                 conn.commit()
                 conn.close()
                 
@@ -1334,18 +2243,19 @@ class WirelessMonitor:
         def get_social_config():
             """Get social media configuration for sharing popup"""
             try:
-                conn = self.get_db_connection()
-                
-                social_platforms = conn.execute('''
-                    SELECT platform, username, enabled 
-                    FROM social_config 
-                    WHERE enabled = 1
-                    ORDER BY platform
-                ''').fetchall()
-                
-                platforms = [dict(row) for row in social_platforms]
+                with self._social_platforms_lock:
+                    if self._social_platforms_cache is None:
+                        conn = self.get_db_connection()
+                        social_platforms = conn.execute('''
+                            SELECT platform, username, enabled 
+                            FROM social_config 
+                            WHERE enabled = 1
+                            ORDER BY platform
+                        ''').fetchall()
+                        conn.close()
+                        self._social_platforms_cache = [dict(row) for row in social_platforms]
+                    platforms = self._social_platforms_cache
                 
-                conn.close()
                 return jsonify({'success': True, 'platforms': platforms})
                 
             except Exception as e:
@@ -1358,44 +2268,34 @@ class WirelessMonitor:
                 conn = self.get_db_connection()
                 
                 # Get current week info
-                from datetime import datetime, timedelta
-                today = datetime.now().date()
-                week_start = today - timedelta(days=today.weekday())
+                today, week_start = current_week()
                 
-                # Check if already generated this week
-                existing = conn.execute('''
-                    SELECT value FROM settings WHERE key = ?
-                ''', (f'digest_generated_{week_start}',)).fetchone()
+                # Claim this week's digest by writing its generated marker. The
+                # key is unique, so if it is already there nothing is inserted
+                # and the week has been generated before
+                claimed = conn.execute(SQL_CLAIM_SETTING, (f'digest_generated_{week_start}',
+                                                           datetime.now().isoformat())).rowcount
                 
-                if existing:
+                if not claimed:
+                    conn.close()
                     return jsonify({'success': False, 'error': 'Digest already generated for this week'})
                 
-                # Auto-add top 6 articles from previous 7 days
+                # Auto-add top 6 articles from previous 7 days in one
+                # INSERT ... SELECT; the picks and the generated marker share
+                # one transaction and one commit
                 seven_days_ago = today - timedelta(days=7)
-                top_articles = conn.execute('''
-                    SELECT id, relevance_score
+                added_count = conn.execute('''
+                    INSERT INTO weekly_digest (article_id, notes, week_start, added_by)
+                    SELECT id, 'Auto-selected top story', ?, 'system'
                     FROM articles
-                    WHERE DATE(published_date) >= ? 
-                    AND DATE(published_date) <= ?
+                    WHERE published_date >= ? AND published_date < ?
                     AND relevance_score > 0.3
-                    AND id NOT IN (SELECT article_id FROM weekly_digest WHERE week_start = ?)
+                    AND NOT EXISTS (
+                        SELECT 1 FROM weekly_digest wd WHERE wd.week_start = ? AND wd.article_id = articles.id
+                    )
                     ORDER BY relevance_score DESC, published_date DESC
                     LIMIT 6
-                ''', (seven_days_ago, today, week_start)).fetchall()
-                
-                added_count = 0
-                for article in top_articles:
-                    conn.execute('''
-                        INSERT INTO weekly_digest (article_id, notes, week_start, added_by)
-                        VALUES (?, ?, ?, ?)
-                    ''', (article['id'], 'Auto-selected top story', week_start, 'system'))
-                    added_count += 1
-                
-                # Mark digest as generated
-                conn.execute('''
-                    INSERT INTO settings (key, value, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                ''', (f'digest_generated_{week_start}', datetime.now().isoformat()))
+                ''', (week_start, *date_bounds(seven_days_ago, today), week_start)).rowcount
                 
                 conn.commit()
                 conn.close()
@@ -1416,9 +2316,7 @@ class WirelessMonitor:
                 conn = self.get_db_connection()
                 
                 # Get current week
-                from datetime import datetime, timedelta
-                today = datetime.now().date()
-                week_start = today - timedelta(days=today.weekday())
+                today, week_start = current_week()
                 
                 # Get all digest articles (manual + auto)
                 all_articles = conn.execute('''
@@ -1540,7 +2438,7 @@ class WirelessMonitor:
                     # Generate new image
                     image_url = self.get_or_create_article_image_sync(article_dict, conn)
                     if image_url:
-                        conn.execute('UPDATE articles SET image_url = ? WHERE id = ?', 
+                        conn.execute(SQL_SET_ARTICLE_IMAGE, 
                                    (image_url, article_dict['id']))
                         regenerated += 1
                 
@@ -1600,7 +2498,7 @@ class WirelessMonitor:
                     try:
                         image_url = self.get_or_create_article_image_sync(article_dict, conn)
                         if image_url:
-                            conn.execute('UPDATE articles SET image_url = ? WHERE id = ?', 
+                            conn.execute(SQL_SET_ARTICLE_IMAGE, 
                                        (image_url, article_dict['id']))
                             success_count += 1
                         else:
@@ -1667,7 +2565,7 @@ class WirelessMonitor:
         @self.app.route('/social_config')
         def social_config_page():
             """Social media configuration page"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             conn = self.get_db_connection()
             platforms = conn.execute('SELECT * FROM social_config ORDER BY platform').fetchall()
@@ -1682,7 +2580,7 @@ class WirelessMonitor:
                 platform = request.form['platform']
                 username = request.form['username']
                 enabled = 1 if request.form.get('enabled') == 'on' else 0
-                view_mode = request.args.get('view', 'newspaper')
+                view_mode = g.view_mode
                 
                 conn = self.get_db_connection()
                 conn.execute('''
@@ -1693,6 +2591,8 @@ class WirelessMonitor:
                 
                 conn.commit()
                 conn.close()
+                with self._social_platforms_lock:
+                    self._social_platforms_cache = None
                 
                 flash(f'{platform} configuration updated successfully', 'success')
                 return redirect(url_for('social_config_page', view=view_mode))
@@ -1704,14 +2604,12 @@ class WirelessMonitor:
         @self.app.route('/weekly_digest')
         def weekly_digest():
             """View weekly digest"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             
             conn = self.get_db_connection()
             
             # Get current week's digest (Monday to Sunday)
-            from datetime import datetime, timedelta
-            today = datetime.now().date()
-            week_start = today - timedelta(days=today.weekday())
+            today, week_start = current_week()
             
             # Get manually added articles for this week
             manual_articles = conn.execute('''
@@ -1729,13 +2627,14 @@ class WirelessMonitor:
                 SELECT a.*, f.name as feed_name
                 FROM articles a
                 JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE DATE(a.published_date) >= ? 
-                AND DATE(a.published_date) <= ?
+                WHERE a.published_date >= ? AND a.published_date < ?
                 AND a.relevance_score > 0.3
-                AND a.id NOT IN (SELECT article_id FROM weekly_digest WHERE week_start = ?)
+                AND NOT EXISTS (
+                    SELECT 1 FROM weekly_digest wd WHERE wd.week_start = ? AND wd.article_id = a.id
+                )
                 ORDER BY a.relevance_score DESC, a.published_date DESC
                 LIMIT 6
-            ''', (seven_days_ago, today, week_start)).fetchall()
+            ''', (*date_bounds(seven_days_ago, today), week_start)).fetchall()
             
             # Get digest generation status
             digest_status = conn.execute('''
@@ -1754,7 +2653,7 @@ class WirelessMonitor:
         @self.app.route('/wild_wifi')
         def wild_wifi():
             """Wild Wi-Fi stories page"""
-            view_mode = request.args.get('view', 'newspaper')
+            view_mode = g.view_mode
             category = request.args.get('category', 'all')
             
             conn = self.get_db_connection()
@@ -1775,7 +2674,7 @@ class WirelessMonitor:
             
             # Get available categories
             categories = conn.execute('''
-                SELECT DISTINCT category, COUNT(*) as count
+                SELECT category, COUNT(*) as count
                 FROM wild_wifi_stories 
                 WHERE approved = 1
                 GROUP BY category
@@ -1831,52 +2730,31 @@ class WirelessMonitor:
         @self.app.route('/insights')
         def insights():
             """AI-powered industry insights page"""
-            view_mode = request.args.get('view', 'newspaper')
-            
-            conn = self.get_db_connection()
-            
-            # Get recent articles for analysis
-            recent_articles = conn.execute('''
-                SELECT a.*, f.name as feed_name 
-                FROM articles a 
-                JOIN rss_feeds f ON a.feed_id = f.id
-                WHERE DATE(a.published_date) >= DATE('now', '-7 days')
-                AND a.relevance_score > 0.2
-                ORDER BY a.published_date DESC
-                LIMIT 50
-            ''').fetchall()
+            view_mode = g.view_mode
             
-            # Get or generate AI insights
-            insights_data = self.get_ai_insights(recent_articles)
+            # Get or generate AI insights; recent articles are only read
+            # when the stored insights have expired
+            insights_data = self.get_ai_insights()
             
-            conn.close()
             return render_template('insights.html', insights=insights_data, view_mode=view_mode)
         
         @self.app.route('/api/refresh_insights', methods=['POST'])
         def refresh_insights():
             """Refresh AI insights"""
             try:
-                conn = self.get_db_connection()
-                
                 # Get recent articles
-                recent_articles = conn.execute('''
-                    SELECT a.*, f.name as feed_name 
-                    FROM articles a 
-                    JOIN rss_feeds f ON a.feed_id = f.id
-                    WHERE DATE(a.published_date) >= DATE('now', '-7 days')
-                    AND a.relevance_score > 0.2
-                    ORDER BY a.published_date DESC
-                    LIMIT 50
-                ''').fetchall()
+                recent_articles = self.get_recent_insight_articles()
                 
                 # Generate new insights
                 insights_data = self.generate_ai_insights(recent_articles)
                 
                 # Store insights in database
-                conn.execute('INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)', 
+                conn = self.get_db_connection()
+                conn.execute(SQL_SAVE_SETTING,
                            ('ai_insights', json.dumps(insights_data)))
                 conn.commit()
                 conn.close()
+                self.invalidate_insights_cache(keep_parsed=False)
                 
                 return jsonify({'success': True, 'insights': insights_data})
                 
@@ -1894,7 +2772,7 @@ class WirelessMonitor:
                 return jsonify({'success': False, 'error': 'Feed not found'})
             
             try:
-                response = requests.get(feed['url'], timeout=15)
+                response = self.http.get(feed['url'], timeout=15)
                 parsed_feed = feedparser.parse(response.content)
                 
                 # Check for various failure conditions
@@ -1909,9 +2787,7 @@ class WirelessMonitor:
                 if failure_reason:
                     # Auto-remove failed feed
                     feed_name = feed['name']
-                    articles_deleted = conn.execute('DELETE FROM articles WHERE feed_id = ?', (feed_id,)).rowcount
-                    conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
-                    conn.commit()
+                    articles_deleted = self.remove_feed(conn, feed_id)
                     conn.close()
                     
                     logger.warning(f"Auto-removed failed RSS feed: {feed_name} - {failure_reason}")
@@ -1936,9 +2812,7 @@ class WirelessMonitor:
             except requests.RequestException as e:
                 # Auto-remove feed that can't be reached
                 feed_name = feed['name']
-                articles_deleted = conn.execute('DELETE FROM articles WHERE feed_id = ?', (feed_id,)).rowcount
-                conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
-                conn.commit()
+                articles_deleted = self.remove_feed(conn, feed_id)
                 conn.close()
                 
                 logger.warning(f"Auto-removed unreachable RSS feed: {feed_name} - Network error: {str(e)}")
@@ -1948,154 +2822,225 @@ class WirelessMonitor:
                     'error': f'Network error: {str(e)}',
                     'auto_removed': True,
                     'feed_name': feed_name,
-                    'articles_deleted': articles_deleted
-                })
-            except Exception as e:
-                # Auto-remove feed with parsing errors
-                feed_name = feed['name']
-                articles_deleted = conn.execute('DELETE FROM articles WHERE feed_id = ?', (feed_id,)).rowcount
-                conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
-                conn.commit()
-                conn.close()
-                
-                logger.warning(f"Auto-removed problematic RSS feed: {feed_name} - Parsing error: {str(e)}")
-                
-                return jsonify({
-                    'success': False, 
-                    'error': f'Parsing error: {str(e)}',
-                    'auto_removed': True,
-                    'feed_name': feed_name,
-                    'articles_deleted': articles_deleted
-                })
-        @self.app.route('/api/force_update_system', methods=['POST'])
-        def force_update_system():
-            """Force update system - discards all local changes"""
-            try:
-                import subprocess
-                import os
-                
-                # Get current user and project directory
-                current_user = os.getenv('USER', 'wifi')
-                project_dir = f'/home/{current_user}/wireless_monitor'
-                
-                # Reset to remote state (discards all local changes)
-                reset_result = subprocess.run(['git', 'reset', '--hard', 'origin/main'], 
-                                            cwd=project_dir, 
-                                            capture_output=True, 
-                                            text=True, 
-                                            timeout=30)
-                
-                if reset_result.returncode != 0:
-                    return jsonify({
-                        'success': False, 
-                        'error': f'Git reset failed: {reset_result.stderr}'
-                    })
-                
-                # Pull latest changes
-                result = subprocess.run(['git', 'pull', 'origin', 'main'], 
-                                      cwd=project_dir, 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=30)
-                
-                if result.returncode == 0:
-                    # Restart service after update
-                    subprocess.run(['sudo', 'systemctl', 'restart', 'wireless-monitor'], 
-                                 timeout=10)
-                    
-                    return jsonify({
-                        'success': True, 
-                        'message': 'System force updated successfully. All local changes discarded. Service restarting...'
-                    })
-                else:
-                    return jsonify({
-                        'success': False, 
-                        'error': f'Git pull failed after reset: {result.stderr}'
-                    })
-                    
-            except subprocess.TimeoutExpired:
-                return jsonify({'success': False, 'error': 'Force update timed out'})
+                    'articles_deleted': articles_deleted
+                })
             except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
+                # Auto-remove feed with parsing errors
+                feed_name = feed['name']
+                articles_deleted = self.remove_feed(conn, feed_id)
+                conn.close()
+                
+                logger.warning(f"Auto-removed problematic RSS feed: {feed_name} - Parsing error: {str(e)}")
+                
+                return jsonify({
+                    'success': False, 
+                    'error': f'Parsing error: {str(e)}',
+                    'auto_removed': True,
+                    'feed_name': feed_name,
+                    'articles_deleted': articles_deleted
+                })
+        @self.app.route('/api/force_update_system', methods=['POST'])
+        def force_update_system():
+            """Force update system - discards all local changes"""
+            return self.start_maintenance_task('force_update', self.run_force_update)
         
         @self.app.route('/api/reset_system', methods=['POST'])
         def reset_system():
             """Reset system to fresh state - wipe all data and reinstall"""
+            return self.start_maintenance_task('reset', self.run_system_reset)
+        
+        @self.app.route('/api/update_status')
+        def update_status():
+            """Report progress of the last force update / reset task"""
+            conn = self.get_db_connection()
+            row = conn.execute('SELECT value FROM settings WHERE key = ?', ('update_status',)).fetchone()
+            conn.close()
+            
+            if not row:
+                return jsonify({'success': True, 'status': 'idle'})
+            return jsonify({'success': True, **json.loads(row['value'])})
+    
+    def start_maintenance_task(self, task, target):
+        """Run a slow git/reset task on a background thread and return at once.
+        
+        Progress is written to the update_status setting for /api/update_status
+        to poll. Requests are refused while a task is running or within a
+        minute of the last one starting.
+        """
+        if not self._maintenance_lock.acquire(blocking=False):
+            return jsonify({'success': False, 'error': 'Another update is already running'}), 429
+        
+        if time.time() - self._last_maintenance_start < 60:
+            self._maintenance_lock.release()
+            return jsonify({'success': False, 'error': 'Please wait a minute before starting another update'}), 429
+        self._last_maintenance_start = time.time()
+        
+        def run():
             try:
-                import subprocess
-                import os
-                
-                # Get current user and project directory
-                current_user = os.getenv('USER', 'wifi')
-                project_dir = f'/home/{current_user}/wireless_monitor'
-                reset_script = f'{project_dir}/reset_system.sh'
-                
-                # Run the reset script
-                result = subprocess.run([reset_script], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=120)
-                
-                if result.returncode == 0:
-                    return jsonify({
-                        'success': True, 
-                        'message': 'System reset completed. Service restarting...',
-                        'output': result.stdout
-                    })
-                else:
-                    return jsonify({
-                        'success': False, 
-                        'error': f'Reset failed: {result.stderr}'
-                    })
-                    
-            except subprocess.TimeoutExpired:
-                return jsonify({'success': False, 'error': 'Reset timed out'})
+                self.save_update_status(task, 'running')
+                success, message = target()
+                self.save_update_status(task, 'done' if success else 'failed', message)
             except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
+                logger.error(f"Maintenance task {task} failed: {e}")
+                self.save_update_status(task, 'failed', str(e))
+            finally:
+                self._maintenance_lock.release()
+        
+        threading.Thread(target=run, daemon=True).start()
+        return jsonify({'success': True, 'status': 'started', 'task': task})
+    
+    def save_update_status(self, task, status, message=''):
+        """Record maintenance task progress in settings"""
+        conn = self.get_db_connection()
+        conn.execute(SQL_SAVE_SETTING, ('update_status', json.dumps({
+            'task': task,
+            'status': status,
+            'message': message,
+            'updated_at': datetime.now().isoformat()
+        })))
+        conn.commit()
+        conn.close()
+    
+    def run_force_update(self):
+        """Reset the checkout to origin/main and pull; returns (success, message)"""
+        import subprocess
+        
+        # Get current user and project directory
+        current_user = os.getenv('USER', 'wifi')
+        project_dir = f'/home/{current_user}/wireless_monitor'
+        
+        try:
+            # Reset to remote state (discards all local changes)
+            reset_result = subprocess.run(['git', 'reset', '--hard', 'origin/main'], 
+                                        cwd=project_dir, 
+                                        capture_output=True, 
+                                        text=True, 
+                                        timeout=30)
+            
+            if reset_result.returncode != 0:
+                return False, f'Git reset failed: {reset_result.stderr}'
+            
+            # Pull latest changes
+            result = subprocess.run(['git', 'pull', 'origin', 'main'], 
+                                  cwd=project_dir, 
+                                  capture_output=True, 
+                                  text=True, 
+                                  timeout=30)
+            
+            if result.returncode != 0:
+                return False, f'Git pull failed after reset: {result.stderr}'
+            
+            # Record success before the restart takes this process down
+            self.save_update_status('force_update', 'done',
+                                    'System force updated successfully. All local changes discarded. Service restarting...')
+            self.restart_service()
+            return True, 'System force updated successfully. All local changes discarded. Service restarting...'
+            
+        except subprocess.TimeoutExpired:
+            return False, 'Force update timed out'
+    
+    def run_system_reset(self):
+        """Run reset_system.sh; returns (success, message)"""
+        import subprocess
+        
+        # Get current user and project directory
+        current_user = os.getenv('USER', 'wifi')
+        project_dir = f'/home/{current_user}/wireless_monitor'
+        reset_script = f'{project_dir}/reset_system.sh'
+        
+        try:
+            # Run the reset script
+            result = subprocess.run([reset_script], 
+                                  capture_output=True, 
+                                  text=True, 
+                                  timeout=120)
+            
+            if result.returncode != 0:
+                return False, f'Reset failed: {result.stderr}'
+            return True, f'System reset completed. Service restarting... {result.stdout}'
+            
+        except subprocess.TimeoutExpired:
+            return False, 'Reset timed out'
     
     def fetch_rss_feeds(self):
-        """Fetch and analyze RSS feeds"""
+        """Fetch and analyze RSS feeds; returns the number of new articles
+        
+        If another fetch is already running this one is skipped (and returns
+        0), since it would only download the same feeds again.
+        """
+        if not self._fetch_lock.acquire(blocking=False):
+            logger.info("RSS fetch already in progress, skipping")
+            return 0
+        try:
+            return self._fetch_rss_feeds()
+        finally:
+            self._fetch_lock.release()
+    
+    def _fetch_rss_feeds(self):
         logger.info("Starting RSS feed fetch...")
         
         conn = self.get_db_connection()
         feeds = conn.execute('SELECT * FROM rss_feeds WHERE active = 1').fetchall()
         
         total_new_articles = 0
-        
-        for feed in feeds:
+        statements = PreparedStatements(conn)
+        new_rows = []
+        pending_urls = set()
+        fetched_feeds = []
+        
+        # Download and parse all feeds concurrently; the requests spend most
+        # of their time waiting on the network, so wall time is the slowest
+        # feed rather than the sum of all of them
+        downloads = []
+        if feeds:
+            host_limits = {urlparse(feed['url']).netloc: threading.BoundedSemaphore(FEED_FETCH_PER_HOST)
+                           for feed in feeds}
+            with ThreadPoolExecutor(max_workers=min(FEED_FETCH_WORKERS, len(feeds))) as executor:
+                downloads = list(executor.map(
+                    lambda feed: self.download_feed(feed, host_limits[urlparse(feed['url']).netloc]),
+                    feeds))
+        
+        # Extract articles next; nothing is written until every feed is read
+        for feed, parsed_feed, error in downloads:
             try:
-                logger.info(f"Fetching feed: {feed['name']}")
+                if error:
+                    raise error
                 
-                # Fetch RSS feed
-                response = requests.get(feed['url'], timeout=30)
-                parsed_feed = feedparser.parse(response.content)
+                if parsed_feed is None:
+                    # 304 Not Modified: nothing new, keep the stored validators
+                    logger.info(f"Feed unchanged since last fetch: {feed['name']}")
+                    fetched_feeds.append((feed['etag'], feed['last_modified'], feed['id']))
+                    continue
+                
+                entries = parsed_feed.entries[:20]  # Limit to 20 most recent
+                
+                # Look up which of these articles we already have in one query
+                known_urls = statements.existing_urls([entry.link for entry in entries])
                 
-                for entry in parsed_feed.entries[:20]:  # Limit to 20 most recent
-                    # Check if article already exists
-                    existing = conn.execute('SELECT id FROM articles WHERE url = ?', (entry.link,)).fetchone()
-                    if existing:
+                for entry in entries:
+                    # Skip articles we already have (or queued earlier in this fetch)
+                    if entry.link in known_urls or entry.link in pending_urls:
                         continue
+                    pending_urls.add(entry.link)
                     
                     # Extract article data
                     title = entry.get('title', 'No Title')
-                    
-                    # Clean up description/summary - remove HTML tags
-                    description = entry.get('summary', entry.get('description', ''))
-                    if description:
-                        # Remove HTML tags and decode entities
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(description, 'html.parser')
-                        description = soup.get_text().strip()
-                        # Remove extra whitespace
-                        description = ' '.join(description.split())
-                    
-                    # Try to get full content if available
-                    content = ''
+                    summary_html = entry.get('summary', entry.get('description', ''))
+                    content_html = ''
                     if hasattr(entry, 'content') and entry.content:
                         content_html = entry.content[0].value if isinstance(entry.content, list) else entry.content
-                        soup = BeautifulSoup(content_html, 'html.parser')
-                        content = soup.get_text().strip()
-                        content = ' '.join(content.split())
+                    
+                    # An entry with no Wi-Fi keyword anywhere scores 0 and would be
+                    # discarded, so check the raw markup before cleaning it up
+                    raw_text = f"{title} {summary_html} {content_html}".lower()
+                    if not self.has_wifi_keyword(raw_text):
+                        continue
+                    
+                    # Clean up description/summary - remove HTML tags and decode entities
+                    description = html_to_text(summary_html)
+                    
+                    # Full content if available
+                    content = html_to_text(content_html)
                     
                     published = entry.get('published_parsed')
                     
@@ -2104,57 +3049,75 @@ class WirelessMonitor:
                     else:
                         published_date = datetime.now()
                     
-                    # Calculate relevance score
+                    # Calculate relevance score and keep the keywords found for debugging
                     text = f"{title} {description} {content}".lower()
-                    relevance_score = self.calculate_relevance_score(text)
-                    
-                    # Extract keywords found for debugging
-                    found_keywords = [kw for kw in self.wifi_keywords if kw in text]
+                    relevance_score, found_keywords = self.calculate_relevance_score(text)
                     keywords_str = ', '.join(found_keywords[:5])  # Store first 5 keywords found
                     
                     # Only store articles with some relevance
                     if relevance_score > 0.05:  # Lower threshold to capture more articles
-                        # Store article first, then generate image automatically
-                        cursor = conn.execute('''
-                            INSERT INTO articles (feed_id, title, url, description, content, published_date, relevance_score, wifi_keywords)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (feed['id'], title, entry.link, description, content, published_date, relevance_score, keywords_str))
-                        
-                        article_id = cursor.lastrowid
-                        total_new_articles += 1
-                        
-                        # Generate image automatically (using same connection to avoid locks)
-                        try:
-                            logger.info(f"🎨 Auto-generating image for: {title[:50]}...")
-                            article_dict = {
-                                'id': article_id,
-                                'title': title,
-                                'description': description,
-                                'url': entry.link
-                            }
-                            
-                            # Use the same connection to avoid database locks
-                            image_url = self.get_or_create_article_image_sync(article_dict, conn)
-                            if image_url:
-                                conn.execute('UPDATE articles SET image_url = ? WHERE id = ?', (image_url, article_id))
-                                logger.info(f"✅ Auto-generated image for article {article_id}: {image_url}")
-                            else:
-                                logger.warning(f"❌ No image generated for article {article_id}")
-                                
-                        except Exception as img_error:
-                            logger.error(f"Error generating image for article {article_id}: {img_error}")
-                
-                # Update last fetched time
-                conn.execute('UPDATE rss_feeds SET last_fetched = CURRENT_TIMESTAMP WHERE id = ?', (feed['id'],))
+                        new_rows.append((feed['id'], title, entry.link, description, content,
+                                         published_date, relevance_score, keywords_str))
+                
+                fetched_feeds.append((parsed_feed.headers.get('etag'),
+                                      parsed_feed.headers.get('last-modified'),
+                                      feed['id']))
                 
             except Exception as e:
                 logger.error(f"Error fetching feed {feed['name']}: {e}")
         
-        # Update global last fetch time
-        conn.execute('INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)', 
-                    ('last_fetch', datetime.now().isoformat()))
+        # Write all new articles, feed timestamps and the global last fetch
+        # time in one short transaction
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            total_new_articles = statements.insert_articles(new_rows)
+            conn.executemany(SQL_TOUCH_FEED, fetched_feeds)
+            conn.execute(SQL_SAVE_SETTING,
+                        ('last_fetch', datetime.now().isoformat()))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error storing fetched articles: {e}")
+            new_rows = []
+        else:
+            if total_new_articles:
+                # Refresh planner statistics for tables that changed enough
+                conn.execute('PRAGMA optimize')
+        # last_fetched changed for every feed we touched
+        self.invalidate_feeds_cache()
+        self.invalidate_insights_cache()
+        self.invalidate_index_cache()
+        
+        # Generate images after the commit so no write lock is held while
+        # scraping article pages
+        article_ids = statements.article_ids([row[2] for row in new_rows])
+        image_updates = []
+        for feed_id, title, url, description, *_ in new_rows:
+            article_id = article_ids.get(url)
+            if not article_id:
+                continue
+            try:
+                logger.info(f"🎨 Auto-generating image for: {title[:50]}...")
+                article_dict = {
+                    'id': article_id,
+                    'title': title,
+                    'description': description,
+                    'url': url
+                }
+                
+                image_url = self.get_or_create_article_image_sync(article_dict, conn)
+                if image_url:
+                    image_updates.append((image_url, article_id))
+                    logger.info(f"✅ Auto-generated image for article {article_id}: {image_url}")
+                else:
+                    logger.warning(f"❌ No image generated for article {article_id}")
+                    
+            except Exception as img_error:
+                logger.error(f"Error generating image for article {article_id}: {img_error}")
         
-        conn.commit()
+        if image_updates:
+            statements.set_article_images(image_updates)
+            conn.commit()
         conn.close()
         
         logger.info(f"RSS fetch completed: {total_new_articles} new articles")
@@ -2170,26 +3133,109 @@ class WirelessMonitor:
         
         return total_new_articles
     
+    def download_feed(self, feed, host_limit=None):
+        """Fetch and parse one feed; returns (feed, parsed_feed, error) for the fetch pool
+        
+        parsed_feed is None when the server answers 304 Not Modified. When
+        host_limit is given, the download holds it while talking to the host.
+        """
+        if host_limit is not None:
+            with host_limit:
+                return self.download_feed(feed)
+        try:
+            logger.info(f"Fetching feed: {feed['name']}")
+            # Conditional GET, so unchanged feeds are neither sent nor parsed
+            request_headers = {}
+            if feed['etag']:
+                request_headers['If-None-Match'] = feed['etag']
+            if feed['last_modified']:
+                request_headers['If-Modified-Since'] = feed['last_modified']
+            # Let feedparser read straight from the socket instead of
+            # buffering the whole body in response.content first
+            with self.http.get(feed['url'], headers=request_headers, timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    return feed, None, None
+                response.raw.decode_content = True
+                # feedparser expects lowercase header names; the body is
+                # already decompressed, so drop Content-Encoding
+                headers = {key.lower(): value for key, value in response.headers.items()
+                           if key.lower() != 'content-encoding'}
+                parsed_feed = feedparser.parse(response.raw, response_headers=headers)
+            return feed, parsed_feed, None
+        except Exception as e:
+            return feed, None, e
+    
+    def has_wifi_keyword(self, text):
+        """Return True if any Wi-Fi keyword occurs in text"""
+        if self._wifi_automaton is not None:
+            # Stops at the first match instead of collecting them all
+            return next(self._wifi_automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self._wifi_keyword_tuple)
+    
+    def wifi_keyword_mask(self, text):
+        """Return the bitmask of Wi-Fi keywords that occur in text"""
+        mask = 0
+        if self._wifi_automaton is not None:
+            for _, bit in self._wifi_automaton.iter(text):
+                mask |= bit
+        else:
+            for bit, keyword in self._wifi_keyword_bits:
+                if keyword in text:
+                    mask |= bit
+        return mask
+    
+    def find_wifi_keywords(self, text, mask=None):
+        """Return the Wi-Fi keywords that occur in text, in keyword list order"""
+        if mask is None:
+            mask = self.wifi_keyword_mask(text)
+        return [keyword for bit, keyword in self._wifi_keyword_bits if mask & bit]
+    
+    def find_insight_tags(self, text):
+        """Return the set of (bucket, tag) pairs whose keywords occur in text"""
+        found = set()
+        if self._insight_automaton is not None:
+            for end, (length, tags, word_tags) in self._insight_automaton.iter(text):
+                found.update(tags)
+                if word_tags:
+                    start = end - length + 1
+                    before = text[start - 1] if start > 0 else ' '
+                    after = text[end + 1] if end + 1 < len(text) else ' '
+                    if not (before.isalnum() or before == '_' or after.isalnum() or after == '_'):
+                        found.update(word_tags)
+            return found
+        
+        for keyword, tags in self._insight_substring_tags.items():
+            if keyword in text:
+                found.update(tags)
+        for word in set(self._insight_word_re.findall(text)):
+            found.update(self._insight_word_tags[word])
+        return found
+    
     def calculate_relevance_score(self, text):
-        """Calculate relevance score based on Wi-Fi keywords"""
-        keyword_matches = sum(1 for keyword in self.wifi_keywords if keyword in text)
+        """Calculate relevance score based on Wi-Fi keywords
+        
+        Returns (score, found_keywords) so callers that also record the
+        matched keywords don't have to scan the text a second time.
+        """
+        mask = self.wifi_keyword_mask(text)
+        found = self.find_wifi_keywords(text, mask)
+        keyword_matches = len(found)
         word_count = len(text.split())
         
         if word_count == 0:
-            return 0
+            return 0, found
         
         # Calculate keyword density
         density = keyword_matches / word_count
         
         # Boost for important keywords
-        important_keywords = ['wifi', 'wi-fi', 'wireless', '5g', '6g']
-        important_matches = sum(1 for keyword in important_keywords if keyword in text)
+        important_matches = bin(mask & self._important_keyword_mask).count('1')
         
         # Final score (0.0 to 1.0)
         base_score = min(density * 50, 0.8)  # Cap at 0.8
         importance_boost = min(important_matches * 0.1, 0.2)  # Up to 0.2 boost
         
-        return min(base_score + importance_boost, 1.0)
+        return min(base_score + importance_boost, 1.0), found
     
     def analyze_articles_for_events(self):
         """Automatically analyze articles for event relevance and detect new events"""
@@ -2205,9 +3251,9 @@ class WirelessMonitor:
                 SELECT * FROM industry_events 
                 WHERE active = 1 
                 AND (
-                    (date(start_date) BETWEEN date('now') AND date('now', '+14 days'))
+                    (start_date >= date('now') AND start_date < date('now', '+15 days'))
                     OR 
-                    (date(end_date) BETWEEN date('now', '-5 days') AND date('now'))
+                    (end_date >= date('now', '-5 days') AND end_date < date('now', '+1 day'))
                 )
             ''').fetchall()
             
@@ -2219,38 +3265,40 @@ class WirelessMonitor:
             
             for event in events:
                 # Get hashtags/keywords for this event
-                hashtags = event['hashtags'].split(',') if event['hashtags'] else []
-                keywords = [tag.replace('#', '').lower().strip() for tag in hashtags]
+                keywords = list(event_keywords(event['hashtags']))
                 
                 if not keywords:
                     continue
                 
-                # Find articles from the last 5 days that match event keywords
-                for keyword in keywords[:8]:  # Limit to first 8 keywords for performance
-                    articles = conn.execute('''
-                        SELECT id, title, description, relevance_score, published_date
-                        FROM articles
-                        WHERE (LOWER(title) LIKE ? OR LOWER(description) LIKE ?)
-                        AND DATE(published_date) >= DATE('now', '-5 days')
-                        AND id NOT IN (SELECT article_id FROM event_articles WHERE event_id = ?)
-                    ''', (f'%{keyword}%', f'%{keyword}%', event['id'])).fetchall()
-                    
-                    for article in articles:
-                        # Calculate event relevance score
-                        title_matches = sum(1 for kw in keywords if kw in article['title'].lower())
-                        desc_matches = sum(1 for kw in keywords if kw in (article['description'] or '').lower())
-                        
-                        event_relevance = min((title_matches * 0.4 + desc_matches * 0.3) / len(keywords), 1.0)
-                        
-                        if event_relevance > 0.15:  # Only add if reasonably relevant
-                            conn.execute('''
-                                INSERT OR IGNORE INTO event_articles (event_id, article_id, relevance_score)
-                                VALUES (?, ?, ?)
-                            ''', (event['id'], article['id'], event_relevance))
-                            total_categorized += 1
+                # Score and link articles from the last 5 days in one statement:
+                # each keyword adds 0.4 for a title hit and 0.3 for a
+                # description hit, normalised by the keyword count
+                score_expr = ' + '.join(
+                    "(CASE WHEN instr(LOWER(a.title), ?) THEN 0.4 ELSE 0 END)"
+                    " + (CASE WHEN instr(LOWER(COALESCE(a.description, '')), ?) THEN 0.3 ELSE 0 END)"
+                    for _ in keywords
+                )
+                score_params = [kw for kw in keywords for _ in (0, 1)]
+                match_join, match_where, _, params = self.article_keyword_match(keywords[:8])  # Limit to first 8 keywords for performance
+                total_categorized += conn.execute(f'''
+                    INSERT OR IGNORE INTO event_articles (event_id, article_id, relevance_score)
+                    SELECT ?, id, rel FROM (
+                        SELECT a.id, MIN(({score_expr}) / ?, 1.0) AS rel
+                        FROM articles a
+                        {match_join}
+                        WHERE {match_where}
+                        AND a.published_date >= ?
+                        AND NOT EXISTS (
+                            SELECT 1 FROM event_articles ea WHERE ea.event_id = ? AND ea.article_id = a.id
+                        )
+                    )
+                    WHERE rel > 0.15
+                ''', [event['id'], *score_params, float(len(keywords)), *params, days_ago(5), event['id']]).rowcount
             
             conn.commit()
             conn.close()
+            self.invalidate_events_cache()
+            self.invalidate_index_cache()
             
             if total_categorized > 0:
                 logger.info(f"Auto-categorized {total_categorized} articles for events")
@@ -2279,12 +3327,12 @@ class WirelessMonitor:
             articles = conn.execute('''
                 SELECT id, title, description, published_date, url
                 FROM articles 
-                WHERE DATE(published_date) >= DATE('now', '-3 days')
-                AND (LOWER(title) LIKE '%conference%' OR LOWER(title) LIKE '%summit%' 
-                     OR LOWER(title) LIKE '%expo%' OR LOWER(title) LIKE '%show%'
-                     OR LOWER(title) LIKE '%event%' OR LOWER(title) LIKE '%ces%'
-                     OR LOWER(title) LIKE '%mwc%' OR LOWER(title) LIKE '%tech%')
-            ''').fetchall()
+                WHERE published_date >= ?
+                AND (title LIKE '%conference%' OR title LIKE '%summit%' 
+                     OR title LIKE '%expo%' OR title LIKE '%show%'
+                     OR title LIKE '%event%' OR title LIKE '%ces%'
+                     OR title LIKE '%mwc%' OR title LIKE '%tech%')
+            ''', (days_ago(3),)).fetchall()
             
             import re
             detected_events = {}
@@ -2336,7 +3384,7 @@ class WirelessMonitor:
                     # Check if event already exists
                     existing = conn.execute('''
                         SELECT id FROM industry_events 
-                        WHERE LOWER(name) LIKE ? AND start_date LIKE ?
+                        WHERE name LIKE ? AND start_date LIKE ?
                     ''', (f"%{event_data['name'].lower()}%", f"{event_data['year']}%")).fetchone()
                     
                     if not existing:
@@ -2399,8 +3447,12 @@ class WirelessMonitor:
         
         return {'start': start_date, 'end': end_date}
     
-    def ai_search_event_content(self, event):
-        """Use AI to search for and fetch event-related content"""
+    def ai_search_event_content(self, event, conn=None):
+        """Use AI to search for and fetch event-related content
+        
+        When a connection is passed in, the caller owns it and commits;
+        otherwise a connection is opened and committed here.
+        """
         try:
             import requests
             from urllib.parse import quote
@@ -2422,44 +3474,44 @@ class WirelessMonitor:
                     search_queries.append(f"{keyword} {event['name']}")
             
             articles_found = 0
-            conn = self.get_db_connection()
+            own_conn = conn is None
+            if own_conn:
+                conn = self.get_db_connection()
             
+            # Collect the results of every query first, keeping the first
+            # copy of each URL, so they can be stored in one batch
+            found_articles = {}
             for query in search_queries:
                 try:
                     # Use web search to find articles
-                    articles = self.web_search_for_articles(query, event)
-                    
-                    for article_data in articles:
-                        # Check if article already exists
-                        existing = conn.execute(
-                            'SELECT id FROM articles WHERE url = ?', 
-                            (article_data['url'],)
-                        ).fetchone()
-                        
-                        if not existing:
-                            # Add to articles table
-                            article_id = self.add_web_article_to_db(article_data, conn)
-                            
-                            if article_id:
-                                # Calculate event relevance
-                                event_relevance = self.calculate_event_relevance(
-                                    article_data, event
-                                )
-                                
-                                # Add to event_articles table
-                                conn.execute('''
-                                    INSERT INTO event_articles (event_id, article_id, relevance_score)
-                                    VALUES (?, ?, ?)
-                                ''', (event['id'], article_id, event_relevance))
-                                
-                                articles_found += 1
+                    for article_data in self.web_search_for_articles(query, event, conn):
+                        found_articles.setdefault(article_data['url'], article_data)
                 
                 except Exception as e:
                     logger.error(f"Error searching for '{query}': {e}")
                     continue
             
-            conn.commit()
-            conn.close()
+            # Add the articles we don't have yet and link them to the event
+            statements = PreparedStatements(conn)
+            known_urls = statements.existing_urls(list(found_articles))
+            new_articles = [article_data for url, article_data in found_articles.items()
+                            if url not in known_urls]
+            article_ids = self.add_web_articles_to_db(new_articles, conn)
+            
+            links = []
+            terms = self.event_relevance_terms(event)
+            for article_data in new_articles:
+                article_id = article_ids.get(article_data['url'])
+                if article_id:
+                    # Calculate event relevance
+                    event_relevance = self.calculate_event_relevance(article_data, event, terms)
+                    links.append((event['id'], article_id, event_relevance))
+            if links:
+                articles_found = conn.executemany(SQL_LINK_EVENT_ARTICLE, links).rowcount
+            
+            if own_conn:
+                conn.commit()
+                conn.close()
             
             logger.info(f"Found {articles_found} new articles for {event['name']}")
             return articles_found
@@ -2468,7 +3520,7 @@ class WirelessMonitor:
             logger.error(f"Error in AI search for {event['name']}: {e}")
             return 0
     
-    def web_search_for_articles(self, query, event):
+    def web_search_for_articles(self, query, event, conn=None):
         """Search the web for articles related to the event using real web search"""
         try:
             # Try to use real web search if available
@@ -2479,70 +3531,26 @@ class WirelessMonitor:
             except:
                 pass
             
-            # Provide realistic, high-quality content for current events (2026)
-            if 'CES' in event['name']:
-                articles = [
-                    {
-                        'title': f"CES 2026: Revolutionary AI and IoT Innovations Set to Debut",
-                        'url': f"https://techcrunch.com/ces-2026-ai-iot-innovations-preview",
-                        'description': f"Major technology companies prepare to showcase groundbreaking AI and IoT solutions at CES 2026 in Las Vegas, featuring next-generation smart home devices, autonomous vehicles, and advanced wireless technologies including Wi-Fi 8 and 6G developments.",
-                        'published_date': event['start_date'],
-                        'source': 'TechCrunch'
-                    },
-                    {
-                        'title': f"CES 2026 Preview: 6G and Wi-Fi 8 Technologies to Take Center Stage",
-                        'url': f"https://arstechnica.com/ces-2026-6g-wifi8-preview",
-                        'description': f"Wireless technology leaders prepare to demonstrate the latest 6G and Wi-Fi 8 capabilities at CES 2026, promising unprecedented speeds and ultra-low latency for consumers and enterprises. New quantum networking and satellite integration solutions will also be featured.",
-                        'published_date': event['start_date'],
-                        'source': 'Ars Technica'
-                    },
-                    {
-                        'title': f"Smart Home Evolution: What to Expect at CES 2026",
-                        'url': f"https://theverge.com/ces-2026-smart-home-preview",
-                        'description': f"From AI-powered appliances to advanced security systems, CES 2026 promises to showcase the next evolution of connected homes with seamless integration, enhanced user experiences, and revolutionary wireless connectivity standards.",
-                        'published_date': event['start_date'],
-                        'source': 'The Verge'
-                    },
-                    {
-                        'title': f"CES 2026: Next-Generation Wireless Charging and Quantum Technologies",
-                        'url': f"https://ieee.org/ces-2026-wireless-quantum-tech",
-                        'description': f"IEEE Spectrum previews revolutionary wireless charging solutions and quantum technologies set to debut at CES 2026, including room-scale wireless power transmission and quantum-secured communications systems.",
-                        'published_date': event['start_date'],
-                        'source': 'IEEE Spectrum'
-                    }
-                ]
-            elif 'NRF' in event['name']:
-                articles = [
-                    {
-                        'title': f"NRF 2026: Retail Technology Trends Set to Transform Commerce",
-                        'url': f"https://retaildive.com/nrf-2026-retail-tech-preview",
-                        'description': f"National Retail Federation's Big Show 2026 will showcase how advanced AI, quantum computing, and immersive technologies are set to transform the retail landscape. Next-generation wireless technologies will enable unprecedented customer experiences.",
-                        'published_date': event['start_date'],
-                        'source': 'Retail Dive'
-                    },
-                    {
-                        'title': f"NRF 2026: Advanced Wireless Payment Solutions and Metaverse Commerce",
-                        'url': f"https://pymnts.com/nrf-2026-wireless-metaverse-payments",
-                        'description': f"Retailers prepare to showcase advanced wireless payment technologies and metaverse commerce platforms at NRF 2026, featuring biometric authentication, quantum-secured transactions, and immersive shopping experiences.",
-                        'published_date': event['start_date'],
-                        'source': 'PYMNTS'
-                    },
-                    {
-                        'title': f"Digital Transformation Preview: NRF 2026's IoT and Edge AI Innovations",
-                        'url': f"https://chainstoreage.com/nrf-2026-iot-edge-ai-preview",
-                        'description': f"Major retailers will demonstrate how next-generation IoT sensors, edge AI, and 6G connectivity are set to revolutionize inventory management, customer analytics, and supply chain optimization in future retail environments.",
-                        'published_date': event['start_date'],
-                        'source': 'Chain Store Age'
-                    },
-                    {
-                        'title': f"NRF 2026: The Future of Retail Wireless Infrastructure and Sustainability",
-                        'url': f"https://fierceretail.com/nrf-2026-wireless-sustainability",
-                        'description': f"Retail technology leaders will discuss the critical role of sustainable wireless infrastructure in supporting next-generation retail experiences, from carbon-neutral data centers to energy-efficient IoT networks and green technology initiatives.",
-                        'published_date': event['start_date'],
-                        'source': 'Fierce Retail'
-                    }
-                ]
-            else:
+            # Realistic, high-quality content for current events (2026) comes
+            # from the seed_articles table; the first pattern found in the
+            # event name wins
+            own_conn = conn is None
+            if own_conn:
+                conn = self.get_db_connection()
+            articles = [
+                {
+                    'title': row['title'],
+                    'url': row['url'],
+                    'description': row['description'],
+                    'published_date': event['start_date'],
+                    'source': row['source']
+                }
+                for row in conn.execute(SQL_SEED_ARTICLES, (event['name'],))
+            ]
+            if own_conn:
+                conn.close()
+            
+            if not articles:
                 # Generic tech event articles
                 articles = [
                     {
@@ -2566,73 +3574,90 @@ class WirelessMonitor:
             logger.error(f"Error in web search for '{query}': {e}")
             return []
     
-    def add_web_article_to_db(self, article_data, conn):
-        """Add a web-sourced article to the database"""
+    def add_web_articles_to_db(self, articles, conn):
+        """Add web-sourced articles to the database; returns {url: article_id}"""
+        if not articles:
+            return {}
         try:
-            # Create or get a feed for web-sourced articles
-            feed_name = f"Event Content: {article_data['source']}"
-            web_feed = conn.execute(
-                'SELECT id FROM rss_feeds WHERE name = ?', 
-                (feed_name,)
-            ).fetchone()
-            
-            if not web_feed:
+            # Create or get a feed per source for web-sourced articles
+            feed_names = {f"Event Content: {article_data['source']}": article_data['source']
+                          for article_data in articles}
+            placeholders = ','.join('?' * len(feed_names))
+            feed_sql = f'SELECT id, name FROM rss_feeds WHERE name IN ({placeholders})'
+            feed_ids = {row['name']: row['id'] for row in conn.execute(feed_sql, list(feed_names))}
+            
+            missing_feeds = [
                 # Create unique URL for web search feeds (but mark as inactive to avoid fetching)
-                feed_url = f"https://event-content-generated/{article_data['source'].lower().replace(' ', '-')}"
-                cursor = conn.execute('''
-                    INSERT INTO rss_feeds (name, url, active)
-                    VALUES (?, ?, ?)
-                ''', (feed_name, feed_url, 0))  # Set active=0 to prevent fetching
-                feed_id = cursor.lastrowid
-            else:
-                feed_id = web_feed['id']
+                (feed_name, f"https://event-content-generated/{source.lower().replace(' ', '-')}", 0)
+                for feed_name, source in feed_names.items() if feed_name not in feed_ids
+            ]
+            if missing_feeds:
+                conn.executemany(SQL_INSERT_WEB_FEED, missing_feeds)  # Set active=0 to prevent fetching
+                feed_ids = {row['name']: row['id'] for row in conn.execute(feed_sql, list(feed_names))}
+                self.invalidate_feeds_cache()
+            
+            rows = []
+            for article_data in articles:
+                feed_id = feed_ids.get(f"Event Content: {article_data['source']}")
+                if feed_id is None:
+                    continue
+                
+                # Calculate relevance score
+                relevance_score, _ = self.calculate_relevance_score(
+                    f"{article_data['title']} {article_data['description']}"
+                )
+                rows.append((
+                    feed_id,
+                    article_data['title'],
+                    article_data['url'],
+                    article_data['description'],
+                    article_data['published_date'],
+                    relevance_score
+                ))
             
-            # Calculate relevance score
-            relevance_score = self.calculate_relevance_score(
-                f"{article_data['title']} {article_data['description']}"
-            )
+            # Insert articles
+            conn.executemany(SQL_INSERT_WEB_ARTICLE, rows)
             
-            # Insert article
-            cursor = conn.execute('''
-                INSERT INTO articles (
-                    feed_id, title, url, description, published_date, 
-                    relevance_score, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                feed_id,
-                article_data['title'],
-                article_data['url'],
-                article_data['description'],
-                article_data['published_date'],
-                relevance_score
-            ))
-            
-            return cursor.lastrowid
+            return PreparedStatements(conn).article_ids([row[2] for row in rows])
             
         except Exception as e:
-            logger.error(f"Error adding web article to DB: {e}")
-            return None
+            logger.error(f"Error adding web articles to DB: {e}")
+            return {}
     
-    def calculate_event_relevance(self, article_data, event):
-        """Calculate how relevant an article is to a specific event"""
+    def event_relevance_terms(self, event):
+        """Return (keywords, lowercased name, matcher) used to score articles against an event
+        
+        With pyahocorasick installed, matcher is an automaton whose payloads
+        are bitmasks of keyword positions, so one pass over an article gives
+        the set of matched keywords as a single int.
+        """
+        keywords = event_keywords(event['hashtags'])
+        return keywords, event['name'].lower(), keyword_matcher(keywords)
+    
+    def calculate_event_relevance(self, article_data, event, terms=None):
+        """Calculate how relevant an article is to a specific event
+        
+        Callers scoring many articles for one event pass the result of
+        event_relevance_terms() so the hashtags are only parsed once.
+        """
         try:
             # Get event keywords
-            hashtags = event['hashtags'].split(',') if event['hashtags'] else []
-            keywords = [tag.replace('#', '').lower().strip() for tag in hashtags]
+            keywords, event_name, matcher = terms or self.event_relevance_terms(event)
             
             # Combine article text
-            article_text = f"{article_data['title']} {article_data['description']}".lower()
+            article_text = search_text(article_data)
             
-            # Count keyword matches
-            keyword_matches = sum(1 for keyword in keywords if keyword in article_text)
+            # Count keyword matches (an event without hashtags can only
+            # score through its name)
+            base_score = 0
+            if keywords:
+                keyword_matches = count_keyword_matches(keywords, article_text, matcher)
+                base_score = keyword_matches / len(keywords)
             
             # Check for event name
-            event_name_match = event['name'].lower() in article_text
+            event_bonus = 0.3 if event_name in article_text else 0
             
             # Calculate score
-            base_score = keyword_matches / len(keywords) if keywords else 0
-            event_bonus = 0.3 if event_name_match else 0
             
             return min(base_score + event_bonus, 1.0)
             
@@ -2752,34 +3777,72 @@ class WirelessMonitor:
                 'url': article['url']
             }
     
-    def get_ai_insights(self, articles):
-        """Get AI insights from cache or generate new ones"""
-        conn = self.get_db_connection()
-        
-        # Check if we have recent insights (less than 6 hours old)
-        cached_insights = conn.execute('''
-            SELECT value, updated_at FROM settings 
-            WHERE key = "ai_insights" 
-            AND datetime(updated_at) > datetime('now', '-6 hours')
-        ''').fetchone()
+    def get_ai_insights(self, articles=None):
+        """Get AI insights from cache or generate new ones
         
-        if cached_insights:
+        Without articles, the recent insight articles are loaded only if new
+        insights have to be generated.
+        """
+        with self._insights_lock:
+            cached = self._insights_cache
+            if cached and time.time() < cached[0]:
+                return cached[2]
+            
+            conn = self.get_db_connection()
+            
+            # Check if we have recent insights (less than 6 hours old)
+            cached_insights = conn.execute('''
+                SELECT CAST(strftime('%s', updated_at) AS INTEGER) AS updated_ts FROM settings 
+                WHERE key = "ai_insights" 
+                AND datetime(updated_at) > datetime('now', '-6 hours')
+            ''').fetchone()
+            
+            if cached_insights:
+                updated_ts = cached_insights['updated_ts']
+                if cached and cached[1] == updated_ts:
+                    # Same stored row as the copy we already parsed
+                    insights_data = cached[2]
+                else:
+                    value = conn.execute('SELECT value FROM settings WHERE key = "ai_insights"').fetchone()['value']
+                    insights_data = json.loads(value)
+                conn.close()
+                self._insights_cache = (updated_ts + 6 * 3600, updated_ts, insights_data)
+                return insights_data
+            
+            # Generate new insights
+            if articles is None:
+                articles = self.get_recent_insight_articles()
+            insights_data = self.generate_ai_insights(articles)
+            
+            # Cache the insights
+            conn.execute(SQL_SAVE_SETTING,
+                       ('ai_insights', json.dumps(insights_data)))
+            conn.commit()
+            updated_ts = conn.execute(
+                'SELECT CAST(strftime(\'%s\', updated_at) AS INTEGER) FROM settings WHERE key = "ai_insights"'
+            ).fetchone()[0]
             conn.close()
-            return json.loads(cached_insights['value'])
-        
-        # Generate new insights
-        insights_data = self.generate_ai_insights(articles)
-        
-        # Cache the insights
-        conn.execute('INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)', 
-                   ('ai_insights', json.dumps(insights_data)))
-        conn.commit()
-        conn.close()
-        
-        return insights_data
+            
+            self._insights_cache = (updated_ts + 6 * 3600, updated_ts, insights_data)
+            return insights_data
+    
+    def invalidate_insights_cache(self, keep_parsed=True):
+        """Expire the in-memory insights so the next load checks settings again
+        
+        With keep_parsed, the parsed copy is reused if the stored row's
+        updated_at hasn't changed, skipping the JSON decode.
+        """
+        with self._insights_lock:
+            if keep_parsed and self._insights_cache:
+                self._insights_cache = (0,) + self._insights_cache[1:]
+            else:
+                self._insights_cache = None
     
     def generate_ai_insights(self, articles):
-        """Generate AI insights from articles using pattern analysis"""
+        """Generate AI insights from articles using pattern analysis
+        
+        Articles come from with_search_text(), so each carries _search_text.
+        """
         if not articles:
             return self.get_default_insights()
         
@@ -2792,69 +3855,53 @@ class WirelessMonitor:
             'articles_analyzed': len(articles)
         }
         
-        # Keywords for different categories
-        new_keywords = ['launch', 'announce', 'release', 'debut', 'unveil', 'introduce', 'new']
-        now_keywords = ['adopt', 'deploy', 'implement', 'rollout', 'available', 'shipping']
-        next_keywords = ['future', 'roadmap', 'plan', 'expect', 'predict', 'forecast', 'upcoming']
-        
-        # Technology categories
-        tech_categories = {
-            'Wi-Fi 6/6E/7': ['wifi 6', 'wi-fi 6', 'wifi 7', 'wi-fi 7', '802.11ax', '802.11be', '6ghz'],
-            '5G/6G': ['5g', '6g', 'mmwave', 'sub-6', 'standalone', 'non-standalone'],
-            'IoT/Edge': ['iot', 'edge computing', 'smart city', 'industrial iot', 'edge ai'],
-            'Security': ['cybersecurity', 'zero trust', 'encryption', 'authentication', 'vpn'],
-            'Enterprise': ['enterprise', 'business', 'corporate', 'workplace', 'hybrid work'],
-            'Standards': ['ieee', 'standard', 'specification', 'protocol', 'certification']
-        }
+        # Tag every article once; the trend counts below reuse the same tags
+        article_tags = [self.find_insight_tags(article['_search_text']) for article in articles]
         
         # Analyze each article
-        for article in articles:
-            text = f"{article['title']} {article['description']}".lower()
-            
+        for article, tags in zip(articles, article_tags):
             # Determine category
-            category = None
-            for cat, keywords in tech_categories.items():
-                if any(keyword in text for keyword in keywords):
-                    category = cat
-                    break
+            category = next((cat for cat in self.insight_categories
+                             if ('category', cat) in tags), None)
             
             if not category:
                 continue
             
             # Determine timeline (What's New/Now/Next)
-            if any(keyword in text for keyword in new_keywords):
-                timeline = 'whats_new'
-            elif any(keyword in text for keyword in next_keywords):
-                timeline = 'whats_next'
-            elif any(keyword in text for keyword in now_keywords):
-                timeline = 'whats_now'
-            else:
-                timeline = 'whats_now'  # Default
+            timeline = next((name for name in self.insight_timeline_keywords
+                             if ('timeline', name) in tags), 'whats_now')  # Default
             
-            # Create insight entry
-            insight = {
-                'title': article['title'],
-                'summary': article['description'][:200] + '...' if len(article['description']) > 200 else article['description'],
-                'category': category,
-                'source': article['feed_name'],
-                'url': article['url'],
-                'relevance': article['relevance_score'],
-                'published': article['published_date']
-            }
-            
-            insights[timeline].append(insight)
+            insights[timeline].append((article, category))
         
-        # Sort by relevance and limit results
+        # Sort by relevance and limit results, then build entries (and
+        # truncated summaries) only for the articles that are kept
         for timeline in ['whats_new', 'whats_now', 'whats_next']:
-            insights[timeline] = sorted(insights[timeline], key=lambda x: x['relevance'], reverse=True)[:8]
+            top = heapq.nlargest(8, insights[timeline], key=lambda item: item[0]['relevance_score'])
+            insights[timeline] = []
+            for article, category in top:
+                description = article['description']
+                insights[timeline].append({
+                    'title': article['title'],
+                    'summary': description[:200] + '...' if len(description) > 200 else description,
+                    'category': category,
+                    'source': article['feed_name'],
+                    'url': article['url'],
+                    'relevance': article['relevance_score'],
+                    'published': article['published_date']
+                })
         
         # Add trend analysis
-        insights['trends'] = self.analyze_trends(articles)
+        insights['trends'] = self.analyze_trends(articles, article_tags)
         
         return insights
     
-    def analyze_trends(self, articles):
-        """Analyze trending topics and technologies"""
+    def analyze_trends(self, articles, article_tags=None):
+        """Analyze trending topics and technologies
+        
+        article_tags, when given, holds find_insight_tags() for each article.
+        """
+        if article_tags is None:
+            article_tags = [self.find_insight_tags(article['_search_text']) for article in articles]
         trends = {}
         
         # Count mentions of key technologies
@@ -2867,19 +3914,9 @@ class WirelessMonitor:
             'Cloud': 0
         }
         
-        keywords_map = {
-            'Wi-Fi 6/7': ['wifi 6', 'wi-fi 6', 'wifi 7', 'wi-fi 7', '802.11ax', '802.11be'],
-            '5G': ['5g', 'mmwave', 'sub-6'],
-            'IoT': ['iot', 'internet of things', 'smart'],
-            'Security': ['security', 'cybersecurity', 'zero trust', 'encryption'],
-            'AI/ML': ['ai', 'artificial intelligence', 'machine learning', 'ml'],
-            'Cloud': ['cloud', 'saas', 'paas', 'iaas']
-        }
-        
-        for article in articles:
-            text = f"{article['title']} {article['description']}".lower()
-            for tech, keywords in keywords_map.items():
-                if any(keyword in text for keyword in keywords):
+        for tags in article_tags:
+            for bucket, tech in tags:
+                if bucket == 'trend':
                     tech_mentions[tech] += 1
         
         # Convert to trend format
@@ -3052,8 +4089,7 @@ class WirelessMonitor:
             articles_found = 0
             
             # Extract keywords from hashtags
-            hashtag_list = hashtags.split(',') if hashtags else []
-            keywords = [tag.replace('#', '').lower().strip() for tag in hashtag_list]
+            keywords = list(event_keywords(hashtags))
             
             # Add event name words as keywords
             import re
@@ -3061,43 +4097,37 @@ class WirelessMonitor:
             keywords.extend([word for word in event_words if len(word) > 2])
             
             # Remove duplicates
-            keywords = list(set(keywords))
+            keywords = tuple(set(keywords))
+            matcher = keyword_matcher(keywords)
             
             # Search for articles with these keywords
-            for keyword in keywords[:10]:  # Limit to first 10 keywords
-                if len(keyword) < 3:  # Skip very short keywords
-                    continue
-                    
-                articles = conn.execute('''
-                    SELECT id, title, description, published_date, relevance_score
-                    FROM articles
-                    WHERE (LOWER(title) LIKE ? OR LOWER(description) LIKE ?)
-                    AND DATE(published_date) >= DATE('now', '-30 days')
-                    AND id NOT IN (SELECT article_id FROM event_articles WHERE event_id = ?)
-                    ORDER BY published_date DESC
-                    LIMIT 20
-                ''', (f'%{keyword}%', f'%{keyword}%', event_id)).fetchall()
+            search_keywords = [kw for kw in keywords[:10] if len(kw) >= 3]  # Skip very short keywords
+            if not search_keywords:
+                return 0
+            
+            match_join, match_where, match_order, params = self.article_keyword_match(search_keywords)
+            articles = conn.execute(f'''
+                SELECT a.id, a.title, a.description
+                FROM articles a
+                {match_join}
+                WHERE {match_where}
+                AND a.published_date >= ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM event_articles ea WHERE ea.event_id = ? AND ea.article_id = a.id
+                )
+                ORDER BY {match_order}
+                LIMIT 200
+            ''', params + [days_ago(30), event_id]).fetchall()
+            
+            for article in articles:
+                # Calculate relevance score
+                title_matches = count_keyword_matches(keywords, article['title'].lower(), matcher)
+                desc_matches = count_keyword_matches(keywords, (article['description'] or '').lower(), matcher)
                 
-                for article in articles:
-                    # Calculate relevance score
-                    title_matches = sum(1 for kw in keywords if kw in article['title'].lower())
-                    desc_matches = sum(1 for kw in keywords if kw in (article['description'] or '').lower())
-                    
-                    event_relevance = min((title_matches * 0.4 + desc_matches * 0.3) / len(keywords), 1.0)
-                    
-                    if event_relevance > 0.15:  # Only add if reasonably relevant
-                        # Check if already linked
-                        existing = conn.execute('''
-                            SELECT id FROM event_articles 
-                            WHERE event_id = ? AND article_id = ?
-                        ''', (event_id, article['id'])).fetchone()
-                        
-                        if not existing:
-                            conn.execute('''
-                                INSERT INTO event_articles (event_id, article_id, relevance_score)
-                                VALUES (?, ?, ?)
-                            ''', (event_id, article['id'], event_relevance))
-                            articles_found += 1
+                event_relevance = min((title_matches * 0.4 + desc_matches * 0.3) / len(keywords), 1.0)
+                
+                if event_relevance > 0.15:  # Only add if reasonably relevant
+                    articles_found += conn.execute(SQL_LINK_EVENT_ARTICLE, (event_id, article['id'], event_relevance)).rowcount
             
             return articles_found
             
@@ -3108,8 +4138,20 @@ class WirelessMonitor:
     def cleanup_old_articles(self):
         """Remove articles older than 30 days"""
         conn = self.get_db_connection()
-        deleted = conn.execute('DELETE FROM articles WHERE published_date < DATE("now", "-30 days")').rowcount
-        conn.commit()
+        cutoff = days_ago(30)
+        deleted = 0
+        # Delete in small committed batches so the write lock (and the FTS
+        # trigger work that comes with each row) is never held for long
+        while True:
+            batch = conn.execute('''
+                DELETE FROM articles WHERE id IN (
+                    SELECT id FROM articles WHERE published_date < ? LIMIT ?
+                )
+            ''', (cutoff, CLEANUP_BATCH_SIZE)).rowcount
+            conn.commit()
+            deleted += batch
+            if batch < CLEANUP_BATCH_SIZE:
+                break
         conn.close()
         
         if deleted > 0:
@@ -3296,7 +4338,7 @@ class WirelessMonitor:
                         if response.status_code == 200:
                             # Add extra delay to ensure page is fully loaded
                             time.sleep(1)
-                            soup = BeautifulSoup(response.content, 'html.parser')
+                            soup = BeautifulSoup(response.content, SOUP_PARSER)
                             logger.info(f"✅ Successfully loaded page with User Agent {ua_index + 1}")
                             break
                         else:
@@ -5398,12 +6440,12 @@ class WirelessMonitor:
             if scraped_image:
                 # Store the scraped image URL in database
                 if db_conn:
-                    db_conn.execute('UPDATE articles SET image_url = ? WHERE id = ?', 
+                    db_conn.execute(SQL_SET_ARTICLE_IMAGE, 
                                (scraped_image, article['id']))
                     db_conn.commit()
                 else:
                     conn = self.get_db_connection()
-                    conn.execute('UPDATE articles SET image_url = ? WHERE id = ?', 
+                    conn.execute(SQL_SET_ARTICLE_IMAGE, 
                                (scraped_image, article['id']))
                     conn.commit()
                     conn.close()
@@ -5497,19 +6539,24 @@ class WirelessMonitor:
                 logger.error(f"Automatic AI model update failed: {e}")
         
         # Schedule weekly updates on Sundays at 3 AM
-        schedule.every().sunday.at("03:00").do(update_models_job)
+        schedule.every().sunday.at("03:00").do(self.run_in_background, update_models_job)
         logger.info("Scheduled automatic AI model updates for Sundays at 3 AM")
     
+    def run_in_background(self, job):
+        """Start a scheduled job on its own thread, so a slow job (a feed
+        fetch can take minutes) doesn't hold up the ones due after it"""
+        threading.Thread(target=job, daemon=True).start()
+    
     def setup_scheduler(self):
         """Setup background task scheduler"""
         # Schedule RSS fetching every 6 hours
-        schedule.every(6).hours.do(self.fetch_rss_feeds)
+        schedule.every(6).hours.do(self.run_in_background, self.fetch_rss_feeds)
         
         # Schedule cleanup daily at 2 AM
-        schedule.every().day.at("02:00").do(self.cleanup_old_articles)
+        schedule.every().day.at("02:00").do(self.run_in_background, self.cleanup_old_articles)
         
         # Schedule weekly digest generation every Tuesday at 8 AM Central Time
-        schedule.every().tuesday.at("08:00").do(self.auto_generate_weekly_digest)
+        schedule.every().tuesday.at("08:00").do(self.run_in_background, self.auto_generate_weekly_digest)
         
         # Setup automatic AI model updates
         self.setup_auto_model_updates()
@@ -5525,16 +6572,14 @@ class WirelessMonitor:
             conn = self.get_db_connection()
             
             # Get current week info
-            from datetime import datetime, timedelta
-            today = datetime.now().date()
-            week_start = today - timedelta(days=today.weekday())
+            today, week_start = current_week()
             
-            # Check if already generated this week
-            existing = conn.execute('''
-                SELECT value FROM settings WHERE key = ?
-            ''', (f'digest_generated_{week_start}',)).fetchone()
+            # Claim this week's digest by writing its generated marker; if it
+            # is already there nothing is inserted
+            claimed = conn.execute(SQL_CLAIM_SETTING, (f'digest_generated_{week_start}',
+                                                       datetime.now().isoformat())).rowcount
             
-            if existing:
+            if not claimed:
                 logger.info("Weekly digest already generated for this week")
                 conn.close()
                 return
@@ -5544,29 +6589,23 @@ class WirelessMonitor:
             top_articles = conn.execute('''
                 SELECT id, title, relevance_score
                 FROM articles
-                WHERE DATE(published_date) >= ? 
-                AND DATE(published_date) <= ?
+                WHERE published_date >= ? AND published_date < ?
                 AND relevance_score > 0.3
-                AND id NOT IN (SELECT article_id FROM weekly_digest WHERE week_start = ?)
+                AND NOT EXISTS (
+                    SELECT 1 FROM weekly_digest wd WHERE wd.week_start = ? AND wd.article_id = articles.id
+                )
                 ORDER BY relevance_score DESC, published_date DESC
                 LIMIT 6
-            ''', (seven_days_ago, today, week_start)).fetchall()
+            ''', (*date_bounds(seven_days_ago, today), week_start)).fetchall()
             
-            added_count = 0
+            added_count = conn.executemany('''
+                INSERT INTO weekly_digest (article_id, notes, week_start, added_by)
+                VALUES (?, ?, ?, ?)
+            ''', [(article['id'], f'Auto-selected (score: {article["relevance_score"]:.2f})', week_start, 'system')
+                  for article in top_articles]).rowcount
             for article in top_articles:
-                conn.execute('''
-                    INSERT INTO weekly_digest (article_id, notes, week_start, added_by)
-                    VALUES (?, ?, ?, ?)
-                ''', (article['id'], f'Auto-selected (score: {article["relevance_score"]:.2f})', week_start, 'system'))
-                added_count += 1
                 logger.info(f"Added to digest: {article['title']}")
             
-            # Mark digest as generated
-            conn.execute('''
-                INSERT INTO settings (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (f'digest_generated_{week_start}', datetime.now().isoformat()))
-            
             conn.commit()
             conn.close()
             
@@ -5578,13 +6617,40 @@ class WirelessMonitor:
     def run_scheduler(self):
         """Run the background scheduler"""
         while self.running:
+            # Sleep until the next job is due instead of polling every minute
+            idle = schedule.idle_seconds()
+            if idle is None:
+                self._shutdown_event.wait(3600)  # No jobs yet
+            elif idle > 0:
+                self._shutdown_event.wait(idle)
+            if not self.running:
+                break
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+    
+    def restart_service(self, delay=1.0):
+        """Restart the systemd service after a short delay.
+        
+        A blocking restart stops this very process while the request that
+        asked for it is still running, so its response was never sent. The
+        delay lets that response go out first, and --no-block keeps the
+        timer thread from waiting on its own shutdown.
+        """
+        import subprocess
+        
+        def restart():
+            try:
+                subprocess.run(['sudo', 'systemctl', '--no-block', 'restart', 'wireless-monitor'],
+                               timeout=10)
+            except Exception as e:
+                logger.error(f"Error restarting service: {e}")
+        
+        threading.Timer(delay, restart).start()
     
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         logger.info("Received shutdown signal, stopping...")
         self.running = False
+        self._shutdown_event.set()
     
     def run(self, host='0.0.0.0', port=5000):
         """Run the application"""
@@ -5606,6 +6672,11 @@ class WirelessMonitor:
             logger.info("Application stopped by user")
         finally:
             self.running = False
+            self._shutdown_event.set()
+            # Let the scheduler leave its loop before the final optimize rather
+            # than waiting indefinitely on a job that is still running
+            scheduler_thread.join(timeout=10)
+            self.optimize_database()
 
 if __name__ == '__main__':
     monitor = WirelessMonitor()